@@ -0,0 +1,121 @@
+import threading
+import time
+from datetime import date, timedelta
+from functools import partial
+
+from DrawArchive import format_search_date, parse_draw_date
+
+# Months per chunk: one search per month or per quarter
+CHUNK_MONTHS = (1, 3)
+DEFAULT_CHUNK_MONTHS = 3
+
+# Searches running at once, and the most searches started per second
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 1.0
+
+
+def split_range(first, last, months=DEFAULT_CHUNK_MONTHS):
+    """
+    Split a date range into chunks that follow calendar months or quarters.
+
+    Chunk edges follow the calendar, not the requested range; the first and
+    last chunk are clipped to the range.
+
+    Returns:
+        list: (start, end) date pairs, oldest first; empty if first is after last
+    """
+    chunks = []
+    # Start of the calendar chunk containing `first`
+    start = date(first.year, (first.month - 1) // months * months + 1, 1)
+    while max(start, first) <= last:
+        month = start.month - 1 + months
+        next_start = date(start.year + month // 12, month % 12 + 1, 1)
+        chunks.append((max(start, first), min(next_start - timedelta(days=1), last)))
+        start = next_start
+    return chunks
+
+
+class RateLimiter:
+    """Spaces out calls to wait() so at most `rate` of them return per second, across threads"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def backfill(archive, game, from_date, to_date, months=DEFAULT_CHUNK_MONTHS, workers=DEFAULT_WORKERS,
+             rate=DEFAULT_RATE, search=None, progress=None):
+    """
+    Download a long range of draws chunk by chunk, several chunks at a time.
+
+    Each finished chunk is written to the archive right away and marked as
+    synced, so running the same backfill again after an interruption only
+    fetches the archive's missing ranges. A chunk that fails doesn't stop the others.
+
+    Args:
+        archive (DrawArchive): Where the draws go
+        game (str): Game name
+        from_date (str): First date, MM/DD/YYYY
+        to_date (str): Last date, MM/DD/YYYY
+        months (int): Months per chunk, 1 or 3
+        workers (int): Most searches running at once
+        rate (float): Most searches started per second, or 0 for no limit
+        search: Function like FetchLatest.search_winning_numbers, which raises FetchError on failure
+        progress: Optional function called with (chunks done, chunks to fetch) as chunks finish
+
+    Returns:
+        tuple: (draws fetched, list of ((start, end), error) for chunks that failed)
+    """
+    # Imported here so the CLI doesn't pay for concurrent.futures on every start
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if search is None:
+        # The archive keeps the draws, so the raw pages don't need to go into the response cache too
+        from FetchLatest import search_winning_numbers
+        search = partial(search_winning_numbers, use_cache=False)
+
+    first, last = parse_draw_date(from_date), parse_draw_date(to_date)
+    # Today's draw may not be posted yet, so it is never marked as synced
+    yesterday = date.today() - timedelta(days=1)
+    pending = [
+        chunk for start, end in archive.missing_ranges(game, first, last)
+        for chunk in split_range(start, end, months)
+    ]
+
+    limiter = RateLimiter(rate)
+
+    def fetch_chunk(start, end):
+        limiter.wait()
+        # Read the whole page first, so a chunk whose page has no results table is never marked
+        fetched = archive.store(game, list(search(game, format_search_date(start), format_search_date(end))))
+        if min(end, yesterday) >= start:
+            archive.mark_synced(game, start, min(end, yesterday))
+        return fetched
+
+    fetched = 0
+    failed = []
+    finished = 0
+    if progress:
+        progress(finished, len(pending))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(fetch_chunk, start, end): (start, end) for start, end in pending}
+        for future in as_completed(futures):
+            try:
+                fetched += future.result()
+            except Exception as e:
+                failed.append((futures[future], e))
+            finished += 1
+            if progress:
+                progress(finished, len(pending))
+
+    return fetched, failed
@@ -0,0 +1,94 @@
+import numpy as np
+
+from TicketMask import encode_tickets, encode_draws, popcount
+
+# Match-matrix cells computed per chunk; bounds the temporary arrays to a few MB
+CHUNK_CELLS = 1 << 22
+
+# Match counts that are reported as hits
+HIT_LEVELS = (3, 4, 5, 6)
+
+
+def iter_match_chunks(ticket_masks, draw_masks, chunk_cells=CHUNK_CELLS):
+    """
+    Compute the tickets x draws match-count matrix a block of tickets at a time.
+
+    Yields:
+        tuple: (first ticket row, uint8 array of shape (rows, len(draw_masks)))
+    """
+    ticket_masks = np.asarray(ticket_masks, dtype=np.uint64)
+    draw_masks = np.asarray(draw_masks, dtype=np.uint64)
+    rows = max(1, chunk_cells // max(1, len(draw_masks)))
+
+    for start in range(0, len(ticket_masks), rows):
+        block = ticket_masks[start:start + rows]
+        yield start, popcount(np.bitwise_and(block[:, None], draw_masks[None, :]))
+
+
+def match_matrix(ticket_masks, draw_masks, chunk_cells=CHUNK_CELLS):
+    """
+    Count the numbers every ticket shares with every draw.
+
+    Returns:
+        numpy.ndarray: uint8 array of shape (tickets, draws)
+    """
+    matrix = np.empty((len(ticket_masks), len(draw_masks)), dtype=np.uint8)
+    for start, block in iter_match_chunks(ticket_masks, draw_masks, chunk_cells):
+        matrix[start:start + len(block)] = block
+    return matrix
+
+
+def hit_counts(ticket_masks, draw_masks, chunk_cells=CHUNK_CELLS):
+    """
+    Count (ticket, draw) pairs by number of matches without keeping the full matrix.
+
+    Returns:
+        dict: {matches: pairs} for every level in HIT_LEVELS
+    """
+    totals = np.zeros(7, dtype=np.int64)
+    for _, block in iter_match_chunks(ticket_masks, draw_masks, chunk_cells):
+        totals += np.bincount(block.ravel(), minlength=7)[:7]
+    return {level: int(totals[level]) for level in HIT_LEVELS}
+
+
+def backtest(tickets, results, keep_matrix=True, chunk_cells=CHUNK_CELLS):
+    """
+    Measure generated tickets against archived draws of a game.
+
+    Args:
+        tickets (numpy.ndarray): (N, 6) ticket array from TicketEngine.generate_tickets
+        results (list): Draws as returned by fetch_latest_winning_numbers
+        keep_matrix (bool): Whether to return the full match matrix as well as the hit counts
+
+    Returns:
+        tuple: (match matrix or None, hit counts dict)
+    """
+    ticket_masks = encode_tickets(tickets)
+    draw_masks = encode_draws(results)
+
+    if not keep_matrix:
+        return None, hit_counts(ticket_masks, draw_masks, chunk_cells)
+
+    matrix = match_matrix(ticket_masks, draw_masks, chunk_cells)
+    totals = np.bincount(matrix.ravel(), minlength=7)
+    return matrix, {level: int(totals[level]) for level in HIT_LEVELS}
+
+
+def stream_hit_counts(ticket_chunks, results, chunk_cells=CHUNK_CELLS):
+    """
+    Like backtest(keep_matrix=False), for tickets that arrive in chunks (e.g. from stream_tickets).
+
+    Only one chunk of tickets is held at a time, so the ticket count is not
+    limited by memory.
+
+    Returns:
+        tuple: (tickets counted, hit counts dict)
+    """
+    draw_masks = encode_draws(results)
+    count = 0
+    totals = dict.fromkeys(HIT_LEVELS, 0)
+    for tickets in ticket_chunks:
+        for level, pairs in hit_counts(encode_tickets(tickets), draw_masks, chunk_cells).items():
+            totals[level] += pairs
+        count += len(tickets)
+    return count, totals
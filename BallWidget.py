@@ -2,6 +2,62 @@ from PyQt5.QtWidgets import QLabel
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QFont, QPainter
 
+# Ball images shared by every BallWidget: decoded once per ball index, and
+# smooth-scaled once per (ball index, size, device pixel ratio)
+_ball_images = {}
+_scaled_balls = {}
+
+
+def ball_image(asset_manager, ball_index):
+    """The decoded image of a ball, loaded on first use"""
+    pixmap = _ball_images.get(ball_index)
+    if pixmap is None:
+        pixmap = asset_manager.load_pixmap(f"Assets/Icons/lottery_ball_{ball_index}.png")
+        if not pixmap.isNull():
+            _ball_images[ball_index] = pixmap
+    return pixmap
+
+
+def scaled_ball(asset_manager, ball_index, width, height, device_pixel_ratio):
+    """
+    A ball image scaled for a widget of the given size on a screen with the given pixel ratio.
+
+    Returns:
+        QPixmap: The scaled image, or a null pixmap if the image couldn't be loaded
+    """
+    key = (ball_index, width, height, device_pixel_ratio)
+    pixmap = _scaled_balls.get(key)
+    if pixmap is None:
+        source = ball_image(asset_manager, ball_index)
+        if source.isNull():
+            return source
+        pixmap = source.scaled(
+            round(width * device_pixel_ratio), round(height * device_pixel_ratio),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        _scaled_balls[key] = pixmap
+    return pixmap
+
+
+def paint_ball(painter, rect, number, ball_index, asset_manager, font_size):
+    """Paint a numbered ball into rect; shared by BallWidget and the item delegates"""
+    pixmap = scaled_ball(asset_manager, ball_index, rect.width(), rect.height(), painter.device().devicePixelRatioF())
+    if not pixmap.isNull():
+        painter.drawPixmap(rect, pixmap)
+    else:
+        painter.setBrush(Qt.GlobalColor.darkYellow)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(rect)
+
+    # Draw centered number
+    custom_color = QColor(25, 25, 75, 255)  # This is a dark blue color with full opacity
+    painter.setPen(custom_color)
+    painter.setFont(QFont("Roboto Condensed", font_size, QFont.Weight.Black))
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(number))
+
+
 class BallWidget(QLabel):
     def __init__(self, number, ball_index, asset_manager, parent=None, size=200, font_size=48):
         super().__init__(parent)
@@ -22,8 +78,7 @@ class BallWidget(QLabel):
         return self.number  # Return the current number of the ball
 
     def load_ball_image(self):
-        image_path = f"Assets/Icons/lottery_ball_{self.ball_index}.png"
-        self.pixmap = self.asset_manager.load_pixmap(image_path)
+        self.pixmap = ball_image(self.asset_manager, self.ball_index)
 
     def update_number(self, new_number, new_index=None):
         self.number = new_number
@@ -34,24 +89,4 @@ class BallWidget(QLabel):
 
     def paintEvent(self, event):
         painter = QPainter(self)
-
-        # Draw ball image if loaded
-        if self.pixmap and not self.pixmap.isNull():
-            scaled_pixmap = self.pixmap.scaled(
-                self.width(), self.height(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            painter.drawPixmap(self.rect(), scaled_pixmap)
-        else:
-            painter.setBrush(Qt.GlobalColor.darkYellow)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(self.rect())
-
-        # Draw centered number
-        custom_color = QColor(25, 25, 75, 255)  # This is a dark blue color with full opacity
-        painter.setPen(custom_color)
-        painter.setFont(QFont("Roboto Condensed", self.font_size, QFont.Weight.Black))
-        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, str(self.number))
-
-    
\ No newline at end of file
+        paint_ball(painter, self.rect(), self.number, self.ball_index, self.asset_manager, self.font_size)
@@ -0,0 +1,89 @@
+"""
+Compare the results-table parser in FetchLatest with the BeautifulSoup parser it replaced.
+
+The fixture is a saved one-month "All Games" results page. Longer ranges are
+simulated by repeating its rows, so the page grows the way a multi-year
+search does while the surrounding markup stays the same.
+
+Run from the repository root:
+
+    python Benchmarks/bench_parser.py
+"""
+import os
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FetchLatest import parse_results_page  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pcso_results_2024_01.html")
+
+# Simulated search ranges, in months
+RANGES = (1, 12, 60)
+
+GAME = "Lotto 6/42"
+
+
+def parse_with_beautifulsoup(html, lottery_type, limit=None):
+    """The original parser: a full html.parser tree, then table.find_all("tr")"""
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table")
+
+    results = []
+    if not table:
+        return []
+
+    for row in table.find_all("tr"):
+        cols = row.find_all("td")
+        if len(cols) < 4:
+            continue
+
+        draw_date = cols[2].get_text(strip=True)
+        game_type = cols[0].get_text(strip=True)
+        if lottery_type in game_type:
+            winning_numbers = [num.zfill(2) for num in cols[1].get_text(strip=True).split('-') if num.isdigit()]
+            if winning_numbers:
+                results.append((draw_date, winning_numbers))
+
+            if limit is not None and len(results) >= limit:
+                break
+
+    return results
+
+
+def scale_page(html, months):
+    """Repeat the fixture's result rows to look like a search over `months` months"""
+    header_end = html.index("</tr>") + len("</tr>")
+    table_end = html.index("</table>")
+    rows = html[header_end:table_end]
+    return html[:header_end] + rows * months + html[table_end:]
+
+
+def best_of(func, repeat=5):
+    """Fastest of `repeat` runs, in milliseconds"""
+    number = 1
+    while timeit.timeit(func, number=number) < 0.2:
+        number *= 2
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    with open(FIXTURE, encoding="utf-8") as f:
+        fixture = f.read()
+
+    print(f"{'months':>6} {'size':>9} {'draws':>6} {'bs4 ms':>9} {'fast ms':>9} {'speedup':>8}")
+    for months in RANGES:
+        html = scale_page(fixture, months)
+        expected = parse_with_beautifulsoup(html, GAME)
+        assert parse_results_page(html, GAME, limit=None) == expected, "parsers disagree"
+
+        slow = best_of(lambda: parse_with_beautifulsoup(html, GAME))
+        fast = best_of(lambda: parse_results_page(html, GAME, limit=None))
+        print(f"{months:>6} {len(html) // 1024:>7}KB {len(expected):>6} {slow:>9.2f} {fast:>9.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
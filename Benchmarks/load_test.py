@@ -0,0 +1,109 @@
+"""
+Load-test the PCSO fetch path against the local stand-in server, fully offline.
+
+Many searches go through one shared PCSOSearchClient from several threads,
+the way a backfill does. Throughput, latency percentiles, failures and how
+often the client had to retry or refresh its form state are reported.
+
+Run from the repository root, e.g.:
+
+    python Benchmarks/load_test.py --requests 500 --concurrency 8 --latency 30 --jitter 20 --error-rate 0.05
+
+Use --url to test against a server that is already running instead.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FetchLatest import FetchError, PCSOSearchClient, create_session, iter_all_results, iter_results  # noqa: E402
+from Games import ALL_GAMES_ID, GAMES  # noqa: E402
+from pcso_server import StandInServer, add_fault_arguments, pcso_from_args  # noqa: E402
+
+# Searches cycle through every game and "All Games" over the fixture's month
+SEARCHES = [(game.game_id, name) for name, game in GAMES.items()] + [(ALL_GAMES_ID, "All Games")]
+FROM_DATE = "01/01/2024"
+TO_DATE = "01/31/2024"
+
+
+def run_search(client, index):
+    """One search and parse; returns (seconds, draws found, error type or None)"""
+    game_id, name = SEARCHES[index % len(SEARCHES)]
+    start = time.perf_counter()
+    try:
+        response = client.search(game_id, FROM_DATE, TO_DATE)
+        rows = iter_all_results(response.text) if game_id == ALL_GAMES_ID else iter_results(response.text, name)
+        draws = sum(1 for _ in rows)
+        error = None
+    except FetchError as e:
+        draws = 0
+        error = type(e).__name__
+    return time.perf_counter() - start, draws, error
+
+
+def percentile(sorted_values, share):
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(share * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def load_test(url, requests, concurrency, max_retries, backoff_base):
+    """Run the searches and return the client together with the per-search results"""
+    session = create_session()
+    client = PCSOSearchClient(base_url=url, session=session, max_retries=max_retries, backoff_base=backoff_base)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda index: run_search(client, index), range(requests)))
+    elapsed = time.perf_counter() - start
+    session.close()
+    return client, results, elapsed
+
+
+def report(client, results, elapsed):
+    latencies = sorted(seconds * 1000 for seconds, _, error in results if error is None)
+    errors = Counter(error for _, _, error in results if error is not None)
+
+    print(f"Searches:    {len(results)} in {elapsed:.2f} s ({len(results) / elapsed:.1f}/s)")
+    print(f"Succeeded:   {len(latencies)} ({sum(draws for _, draws, _ in results)} draws parsed)")
+    if latencies:
+        print(f"Latency ms:  mean {statistics.fmean(latencies):.1f}  p50 {percentile(latencies, 0.50):.1f}  "
+              f"p95 {percentile(latencies, 0.95):.1f}  p99 {percentile(latencies, 0.99):.1f}  "
+              f"max {latencies[-1]:.1f}")
+    print(f"Retries:     {client.retries}")
+    print(f"Refreshes:   {client.refreshes}")
+    for error, count in errors.most_common():
+        print(f"Failed:      {count} x {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the PCSO client against a local stand-in server.")
+    parser.add_argument("--url", help="Search page of a running server (default: start a stand-in server here)")
+    parser.add_argument("--requests", type=int, default=200, help="Searches to run (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Searches running at once (default: 4)")
+    parser.add_argument("--max-retries", type=int, default=3, help="Client retries per request (default: 3)")
+    parser.add_argument("--backoff", type=float, default=0.05,
+                        help="Client backoff base in seconds (default: 0.05, shorter than the app's)")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    if args.url:
+        client, results, elapsed = load_test(args.url, args.requests, args.concurrency, args.max_retries, args.backoff)
+        report(client, results, elapsed)
+        return
+
+    with StandInServer(pcso_from_args(args)) as server:
+        client, results, elapsed = load_test(server.url, args.requests, args.concurrency, args.max_retries, args.backoff)
+        report(client, results, elapsed)
+        print(f"Server:      {server.pcso.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Local stand-in for PCSO's SearchLottoResult.aspx, served from a saved results page.
+
+It follows the same ASP.NET flow as the real site: a GET returns the search
+page with its hidden form fields, and a POST with those fields returns the
+draws of the selected game and date range. Latency, failures and expiring
+form state can be injected to see how the client copes.
+
+Run from the repository root:
+
+    python Benchmarks/pcso_server.py --port 8765 --latency 50 --error-rate 0.05
+
+and point a PCSOSearchClient at http://127.0.0.1:8765/SearchLottoResult.aspx,
+or the whole app by setting LOTTO_PCSO_URL to that address.
+"""
+import argparse
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from datetime import date, datetime
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FetchLatest import MONTH_MAP, iter_table_rows  # noqa: E402
+from Games import ALL_GAMES_ID, GAMES  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pcso_results_2024_01.html")
+
+PATH = "/SearchLottoResult.aspx"
+
+FIELD_PREFIX = "ctl00$ctl00$cphContainer$cpContent$"
+
+MONTH_NUMBERS = {name: int(number) for number, name in MONTH_MAP.items()}
+
+GAME_NAMES = {game.game_id: name for name, game in GAMES.items()}
+
+
+class StandInPCSO:
+    """
+    The fixture page split into a template and its result rows, plus the fault settings.
+
+    Args:
+        latency (float): Mean extra delay per request, in seconds
+        jitter (float): Random +/- spread around the latency, in seconds
+        error_rate (float): Share of requests answered 503 Service Unavailable
+        reset_rate (float): Share of requests whose connection is dropped without an answer
+        state_lifetime (int): Searches a form state is accepted for before it expires, 0 for never
+    """
+
+    def __init__(self, fixture=FIXTURE, latency=0.0, jitter=0.0, error_rate=0.0, reset_rate=0.0, state_lifetime=0):
+        with open(fixture, encoding="utf-8") as f:
+            page = f.read()
+
+        # Everything before the first result row and after the last one is kept as the page template
+        header_end = page.index("</tr>", page.index("<table")) + len("</tr>")
+        table_end = page.index("</table>", header_end)
+        self.head = page[:header_end]
+        self.tail = page[table_end:]
+        self.rows = list(iter_table_rows(page))
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.reset_rate = reset_rate
+        self.state_lifetime = state_lifetime
+
+        self.lock = threading.Lock()
+        self.viewstate = None
+        self.searches_left = 0
+        self.stats = {"GET": 0, "POST": 0, "errors": 0, "resets": 0, "rejected": 0}
+
+    def count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def current_viewstate(self):
+        """The form state to hand out, replaced once the old one has expired"""
+        with self.lock:
+            if self.viewstate is None or (self.state_lifetime and self.searches_left <= 0):
+                self.viewstate = secrets.token_urlsafe(48)
+                self.searches_left = self.state_lifetime
+            return self.viewstate
+
+    def accept_viewstate(self, viewstate):
+        """Whether a posted form state is current, counting it against its lifetime"""
+        with self.lock:
+            if viewstate != self.viewstate:
+                return False
+            if self.state_lifetime:
+                if self.searches_left <= 0:
+                    return False
+                self.searches_left -= 1
+            return True
+
+    def page(self, rows):
+        """The search page with the current form state and the given result rows"""
+        head = self.head
+        # Swap the recorded __VIEWSTATE for the one this server will accept
+        start = head.index('value="', head.index('name="__VIEWSTATE"')) + len('value="')
+        end = head.index('"', start)
+        head = head[:start] + self.current_viewstate() + head[end:]
+
+        body = "".join(
+            "\n\t\t\t\t<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>" for row in rows
+        )
+        return head + body + "\n\t\t\t" + self.tail
+
+    def search(self, fields):
+        """Rows matching a posted search form"""
+        def field(name):
+            return fields.get(FIELD_PREFIX + name, [""])[0]
+
+        try:
+            first = date(int(field("ddlStartYear")), MONTH_NUMBERS[field("ddlStartMonth")], int(field("ddlStartDate")))
+            last = date(int(field("ddlEndYear")), MONTH_NUMBERS[field("ddlEndMonth")], int(field("ddlEndDay")))
+        except (KeyError, ValueError):
+            return []
+
+        game_id = field("ddlSelectGame")
+        game_name = None if game_id == ALL_GAMES_ID else GAME_NAMES.get(game_id)
+
+        matches = []
+        for row in self.rows:
+            draw_date = datetime.strptime(row[2], "%m/%d/%Y").date()
+            if first <= draw_date <= last and (game_name is None or row[0] == game_name):
+                matches.append(row)
+        return matches
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real site
+    disable_nagle_algorithm = True  # Headers and body go out separately; don't let them wait on delayed ACKs
+
+    def log_message(self, format, *args):
+        pass
+
+    def inject_faults(self):
+        """Sleep and maybe fail the request; True if it has been dealt with"""
+        pcso = self.server.pcso
+        delay = pcso.latency + random.uniform(-pcso.jitter, pcso.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        roll = random.random()
+        if roll < pcso.reset_rate:
+            pcso.count("resets")
+            self.close_connection = True
+            self.connection.close()
+            return True
+        if roll < pcso.reset_rate + pcso.error_rate:
+            pcso.count("errors")
+            self.send_text(503, "Service Unavailable")
+            return True
+        return False
+
+    def send_text(self, status, text):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        pcso = self.server.pcso
+        pcso.count("GET")
+        if self.path.split("?")[0] != PATH:
+            self.send_text(404, "Not Found")
+            return
+        if self.inject_faults():
+            return
+        self.send_text(200, pcso.page([]))
+
+    def do_POST(self):
+        pcso = self.server.pcso
+        pcso.count("POST")
+        length = int(self.headers.get("Content-Length", 0))
+        fields = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if self.path.split("?")[0] != PATH:
+            self.send_text(404, "Not Found")
+            return
+        if self.inject_faults():
+            return
+
+        if not pcso.accept_viewstate(fields.get("__VIEWSTATE", [""])[0]):
+            pcso.count("rejected")
+            self.send_text(500, "<h2>Validation of viewstate MAC failed.</h2>")
+            return
+        self.send_text(200, pcso.page(pcso.search(fields)))
+
+
+class StandInServer:
+    """A StandInPCSO served on a background thread, for tests and load tests"""
+
+    def __init__(self, pcso=None, host="127.0.0.1", port=0):
+        self.pcso = pcso or StandInPCSO()
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.pcso = self.pcso
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{PATH}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def add_fault_arguments(parser):
+    """Fault injection options shared with the load test"""
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean extra delay per request in ms (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- spread around the latency in ms (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered 503 (default: 0)")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="Share of connections dropped without an answer (default: 0)")
+    parser.add_argument("--state-lifetime", type=int, default=0,
+                        help="Searches a form state is accepted for, 0 for never expiring (default: 0)")
+
+
+def pcso_from_args(args):
+    return StandInPCSO(latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+                       reset_rate=args.reset_rate, state_lifetime=args.state_lifetime)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the PCSO results search.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = StandInServer(pcso_from_args(args), args.host, args.port)
+    print(f"Serving {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(server.pcso.stats)
+
+
+if __name__ == "__main__":
+    main()
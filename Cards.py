@@ -0,0 +1,36 @@
+from PyQt5.QtWidgets import QStyle
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QLinearGradient, QPainterPath
+
+# Card layout shared by the results and history delegates, matching the old QFrame cards
+CARD_SPACING = 15
+CARD_PADDING = 10
+CARD_RADIUS = 15
+BALL_SIZE = 100
+BALL_FONT_SIZE = 24
+
+
+def card_rect(option, height):
+    """Where a card of the given height sits inside its item rect"""
+    return QRect(option.rect.x() + 5, option.rect.y(), option.rect.width() - 10, height)
+
+
+def paint_card_background(painter, option, height):
+    """
+    Paint a rounded card background, a little brighter under the mouse.
+
+    Returns:
+        QRect: The card's rect, for laying out its contents
+    """
+    card = card_rect(option, height)
+    gradient = QLinearGradient(card.topLeft(), card.topRight())
+    if option.state & QStyle.State_MouseOver:
+        gradient.setColorAt(0, QColor(60, 85, 180, 204))
+        gradient.setColorAt(1, QColor(70, 95, 200, 204))
+    else:
+        gradient.setColorAt(0, QColor(55, 55, 150, 178))
+        gradient.setColorAt(1, QColor(60, 85, 180, 178))
+    path = QPainterPath()
+    path.addRoundedRect(card.x(), card.y(), card.width(), card.height(), CARD_RADIUS, CARD_RADIUS)
+    painter.fillPath(path, gradient)
+    return card
@@ -0,0 +1,66 @@
+from functools import lru_cache
+from math import comb
+
+
+@lru_cache(maxsize=None)
+def binomial_rows(n, k):
+    """
+    Table of binomial coefficients with rows[c][i] == C(c, i), built once per (n, k).
+
+    Args:
+        n (int): Largest pool size needed
+        k (int): Largest combination size needed
+
+    Returns:
+        tuple: n + 1 tuples of k + 1 ints
+    """
+    return tuple(tuple(comb(c, i) for i in range(k + 1)) for c in range(n + 1))
+
+
+def rank_combination(combination, n, k):
+    """
+    Inverse of unrank_combination: the colex rank of a k-combination of range(n).
+
+    Args:
+        combination (iterable): k distinct integers in range(n)
+        n (int): Size of the pool the combination is drawn from
+        k (int): Number of elements in the combination
+
+    Returns:
+        int: The rank, in [0, C(n, k))
+    """
+    rows = binomial_rows(n, k)
+    return sum(rows[c][i] for i, c in enumerate(sorted(combination), start=1))
+
+
+def unrank_combination(rank, n, k):
+    """
+    Convert a rank in [0, C(n, k)) to the k-combination of range(n) it stands for.
+
+    Uses the combinatorial number system (colex order), so no other
+    combination has to be built to find the one at the given rank.
+
+    Args:
+        rank (int): The rank of the combination
+        n (int): Size of the pool the combination is drawn from
+        k (int): Number of elements in the combination
+
+    Returns:
+        tuple: The combination as k ascending integers in range(n)
+    """
+    rows = binomial_rows(n, k)
+    if not 0 <= rank < rows[n][k]:
+        raise ValueError(f"rank {rank} is out of range for C({n}, {k})")
+
+    combination = []
+    c = n
+    for i in range(k, 0, -1):
+        # Largest c such that C(c, i) <= rank
+        c -= 1
+        while rows[c][i] > rank:
+            c -= 1
+        combination.append(c)
+        rank -= rows[c][i]
+
+    return tuple(reversed(combination))
+
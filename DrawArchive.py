@@ -0,0 +1,235 @@
+from datetime import date, datetime, timedelta
+
+from SQLiteStore import SQLiteStore
+
+# Date formats PCSO and the date pickers use
+DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y")
+
+
+def parse_draw_date(text):
+    """
+    Parse a draw date as written by PCSO or the date pickers.
+
+    Raises:
+        ValueError: If the text matches none of DATE_FORMATS
+    """
+    text = text.strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized draw date: {text}")
+
+
+def format_draw_date(day):
+    """Write a date the way PCSO does, e.g. 4/5/2025"""
+    return f"{day.month}/{day.day}/{day.year}"
+
+
+def format_search_date(day):
+    """Write a date the way fetch_latest_winning_numbers expects it, MM/DD/YYYY"""
+    return day.strftime("%m/%d/%Y")
+
+
+class DrawArchive(SQLiteStore):
+    """
+    On-disk archive of draws, keyed by (game, draw date).
+
+    Besides the draws it remembers which date ranges have been synced for each
+    game, so a sync only asks PCSO for the dates it doesn't have yet.
+    """
+
+    FILENAME = "draws.sqlite3"
+
+    def __init__(self, path=None):
+        super().__init__(path)
+        with self.connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS draws (
+                    game TEXT NOT NULL,
+                    draw_date TEXT NOT NULL,
+                    numbers TEXT NOT NULL,
+                    PRIMARY KEY (game, draw_date)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS synced_intervals (
+                    game TEXT NOT NULL,
+                    first_date TEXT NOT NULL,
+                    last_date TEXT NOT NULL,
+                    PRIMARY KEY (game, first_date)
+                )
+            """)
+            # Archives from before synced intervals kept a single range per game
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'synced_ranges'").fetchone():
+                conn.execute("INSERT OR IGNORE INTO synced_intervals SELECT game, first_date, last_date FROM synced_ranges")
+                conn.execute("DROP TABLE synced_ranges")
+            # Finished backfill chunks used to be recorded separately; synced_intervals covers them
+            conn.execute("DROP TABLE IF EXISTS backfill_chunks")
+
+    def store(self, game, results):
+        """
+        Insert or update draws of a game.
+
+        Args:
+            game (str): Game name
+            results (iterable): (draw_date, numbers) tuples as returned by fetch_latest_winning_numbers
+
+        Returns:
+            int: Number of draws written
+        """
+        rows = [
+            (game, parse_draw_date(draw_date).isoformat(), "-".join(numbers))
+            for draw_date, numbers in results
+        ]
+        with self.connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO draws (game, draw_date, numbers) VALUES (?, ?, ?)", rows)
+        return len(rows)
+
+    def draws(self, game, from_date, to_date, limit=None):
+        """
+        Stored draws of a game between two dates, newest first.
+
+        Args:
+            from_date (str): First date, MM/DD/YYYY
+            to_date (str): Last date, MM/DD/YYYY
+            limit (int): Maximum number of draws to return, or None for all
+
+        Returns:
+            list: (draw_date, numbers) tuples in the same shape fetch_latest_winning_numbers returns
+        """
+        query = "SELECT draw_date, numbers FROM draws WHERE game = ? AND draw_date BETWEEN ? AND ? ORDER BY draw_date DESC"
+        params = [game, parse_draw_date(from_date).isoformat(), parse_draw_date(to_date).isoformat()]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self.connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [(format_draw_date(date.fromisoformat(day)), numbers.split("-")) for day, numbers in rows]
+
+    def synced_intervals(self, game):
+        """Non-overlapping (first, last) date ranges already synced for a game, oldest first"""
+        with self.connect() as conn:
+            rows = conn.execute(
+                "SELECT first_date, last_date FROM synced_intervals WHERE game = ? ORDER BY first_date", (game,)
+            ).fetchall()
+        return [(date.fromisoformat(first), date.fromisoformat(last)) for first, last in rows]
+
+    def mark_synced(self, game, first, last):
+        """Record that every draw of a game from first to last is stored, merging touching intervals"""
+        with self.connect() as conn:
+            # Read and rewrite the intervals in one write transaction, so concurrent marks can't lose each other
+            conn.execute("BEGIN IMMEDIATE")
+            touching = conn.execute(
+                "SELECT first_date, last_date FROM synced_intervals WHERE game = ? AND first_date <= ? AND last_date >= ?",
+                (game, (last + timedelta(days=1)).isoformat(), (first - timedelta(days=1)).isoformat())
+            ).fetchall()
+            for interval_first, interval_last in touching:
+                first = min(first, date.fromisoformat(interval_first))
+                last = max(last, date.fromisoformat(interval_last))
+            conn.executemany(
+                "DELETE FROM synced_intervals WHERE game = ? AND first_date = ?",
+                [(game, interval_first) for interval_first, _ in touching]
+            )
+            conn.execute(
+                "INSERT INTO synced_intervals (game, first_date, last_date) VALUES (?, ?, ?)",
+                (game, first.isoformat(), last.isoformat())
+            )
+
+    def is_synced(self, game, first, last):
+        """Whether every draw of a game from first to last is already stored"""
+        return not self.missing_ranges(game, first, last)
+
+    def missing_ranges(self, game, first, last):
+        """
+        Date ranges between first and last that still have to be fetched.
+
+        Only the requested dates are returned; gaps between synced intervals
+        outside of them are left alone.
+        """
+        missing = []
+        for synced_first, synced_last in self.synced_intervals(game):
+            if synced_last < first:
+                continue
+            if synced_first > last:
+                break
+            if synced_first > first:
+                missing.append((first, synced_first - timedelta(days=1)))
+            first = synced_last + timedelta(days=1)
+            if first > last:
+                return missing
+        missing.append((first, last))
+        return missing
+
+    def sync(self, game, from_date, to_date, search=None):
+        """
+        Fetch and store the draws of a game that the archive doesn't have yet.
+
+        Today is never marked as synced because its draw may not be posted
+        yet, so it is asked for again on the next sync.
+
+        Args:
+            from_date (str): First date, MM/DD/YYYY
+            to_date (str): Last date, MM/DD/YYYY
+            search: Function like FetchLatest.search_winning_numbers, which raises FetchError on failure
+
+        Returns:
+            int: Number of draws fetched
+        """
+        if search is None:
+            from FetchLatest import search_winning_numbers as search
+
+        first, last = parse_draw_date(from_date), parse_draw_date(to_date)
+        fetched = 0
+        for start, end in self.missing_ranges(game, first, last):
+            # Read the whole page before storing, so a page without a results table
+            # raises here and its range is never marked as synced
+            results = list(search(game, format_search_date(start), format_search_date(end)))
+            fetched += self.store(game, results)
+
+            # Only completed days count as synced
+            synced_end = min(end, date.today() - timedelta(days=1))
+            if synced_end >= start:
+                self.mark_synced(game, start, synced_end)
+        return fetched
+
+    def sync_all(self, from_date, to_date, games=None, search_all=None):
+        """
+        Like sync, but for every game at once with a single "All Games" search.
+
+        The search spans everything any game is missing within the requested
+        dates, and every game's draws in it are stored, so that span counts as
+        synced for all of them.
+
+        Args:
+            from_date (str): First date, MM/DD/YYYY
+            to_date (str): Last date, MM/DD/YYYY
+            games (iterable): Game names to keep, default every game in Games.GAMES
+            search_all: Function like FetchLatest.search_all_games, which raises FetchError on failure
+
+        Returns:
+            dict: Game name -> number of draws fetched
+        """
+        if search_all is None:
+            from FetchLatest import search_all_games as search_all
+        if games is None:
+            from Games import GAMES as games
+
+        first, last = parse_draw_date(from_date), parse_draw_date(to_date)
+        missing = [missing_range for game in games for missing_range in self.missing_ranges(game, first, last)]
+        if not missing:
+            return {game: 0 for game in games}
+
+        start = min(missing_start for missing_start, _ in missing)
+        end = max(missing_end for _, missing_end in missing)
+        results = search_all(format_search_date(start), format_search_date(end))
+
+        fetched = {}
+        synced_end = min(end, date.today() - timedelta(days=1))
+        for game in games:
+            fetched[game] = self.store(game, results.get(game, []))
+            if synced_end >= start:
+                self.mark_synced(game, start, synced_end)
+        return fetched
@@ -1,7 +1,40 @@
 import csv
 
-def export_data_to_csv(file_path, lucky_numbers, frequency_data, combinations_table, recent_results_table, history_table):
-    """Export all data to a CSV file"""
+def write_rows(writer, table, empty_message):
+    """
+    Write the rows of a QTableWidget or of any iterable of rows.
+
+    Returns:
+        int: Number of rows written; if none, a row with empty_message is written instead
+    """
+    written = 0
+    if table is not None and hasattr(table, 'rowCount'):
+        for row in range(table.rowCount()):
+            row_data = []
+            for col in range(table.columnCount()):
+                item = table.item(row, col)
+                row_data.append(item.text() if item else "")
+            writer.writerow(row_data)
+            written += 1
+    elif table is not None:
+        for row_data in table:
+            writer.writerow(row_data)
+            written += 1
+
+    if not written:
+        writer.writerow([empty_message, "", "", "", "", "", ""])
+    return written
+
+def export_data_to_csv(file_path, lucky_numbers, frequency_data, combinations_table, recent_results_table, history_table,
+                       pick=6):
+    """
+    Export all data to a CSV file.
+
+    recent_results_table and history_table can be QTableWidgets or any iterable
+    of rows, such as the results model's rows or HistoryStore.export_rows(),
+    which is written without loading it all first. pick is the number of
+    numbers per draw, for the column headers.
+    """
     with open(file_path, "w", newline="") as file:
         writer = csv.writer(file)
         
@@ -39,34 +72,16 @@ def export_data_to_csv(file_path, lucky_numbers, frequency_data, combinations_ta
                 writer.writerow(row_data)
             writer.writerow([])
         
+        number_columns = [str(i) for i in range(1, pick + 1)]
+
         writer.writerow(["Recent Results:"])
-        writer.writerow(["Draw", "1", "2", "3", "4", "5", "6"])
-        
-        if recent_results_table and hasattr(recent_results_table, 'rowCount') and recent_results_table.rowCount() > 0:
-            for row in range(recent_results_table.rowCount()):
-                row_data = []
-                for col in range(recent_results_table.columnCount()):
-                    item = recent_results_table.item(row, col)
-                    row_data.append(item.text() if item else "")
-                writer.writerow(row_data)
-        else:
-            # Write an empty row if no results are available
-            writer.writerow(["No recent results available", "", "", "", "", "", ""])
+        writer.writerow(["Draw"] + number_columns)
+        write_rows(writer, recent_results_table, "No recent results available")
         
         writer.writerow([])
 
         writer.writerow(["Lucky Numbers History:"])
-        writer.writerow(["Lotto Type", "1", "2", "3", "4", "5", "6"])
-        
-        if history_table and hasattr(history_table, 'rowCount') and history_table.rowCount() > 0:
-            for row in range(history_table.rowCount()):
-                row_data = []
-                for col in range(history_table.columnCount()):
-                    item = history_table.item(row, col)
-                    row_data.append(item.text() if item else "")
-                writer.writerow(row_data)
-        else:
-            # Write an empty row if no history is available
-            writer.writerow(["No history available", "", "", "", "", "", ""])
-            
+        writer.writerow(["Lotto Type"] + number_columns + ["Seed", "Sample Size", "Workers"])
+        write_rows(writer, history_table, "No history available")
+
     return True
\ No newline at end of file
@@ -1,14 +1,18 @@
+import os
+import random
+import re
+import threading
+import time
+from datetime import date
+from html import unescape
+from itertools import islice
+
 import requests
-from bs4 import BeautifulSoup
+import requests.adapters
 
+from Games import ALL_GAMES_ID, GAMES, get_game
+from ResponseCache import ResponseCache
 
-LOTTERY_CONFIG = {
-    "Ultra Lotto 6/58": (1, 58), 
-    "Grand Lotto 6/55": (1, 55), 
-    "Superlotto 6/49": (1, 49), 
-    "Megalotto 6/45": (1, 45), 
-    "Lotto 6/42": (1, 42)
-}
 
 MONTH_MAP = {
     "01": "January", "02": "February", "03": "March", "04": "April",
@@ -16,94 +20,405 @@ MONTH_MAP = {
     "09": "September", "10": "October", "11": "November", "12": "December"
 }
 
-LOTTERY_TYPE_MAP = {
-    "All Games": "0",
-    "Ultra Lotto 6/58": "18",
-    "Grand Lotto 6/55": "17",
-    "Super Lotto 6/49": "1",
-    "Mega Lotto 6/45": "2",
-    "Lotto 6/42": "13",
+BASE_URL = "https://www.pcso.gov.ph/SearchLottoResult.aspx"
+
+# Point the app at another server, e.g. the stand-in in Benchmarks/pcso_server.py
+BASE_URL_ENV = "LOTTO_PCSO_URL"
+
+# Simulate a browser request (important for some sites)
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36",
 }
 
+# (connect, read) timeouts in seconds, used for every request
+TIMEOUT = (5, 20)
+
+# Retries of a failed request, and the exponential backoff between them
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+
+# Responses that mean "try again later"
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Keep-alive connection pool shared by every search
+POOL_CONNECTIONS = 2
+POOL_MAXSIZE = 8
+
+# Times a search is re-posted with fresh form state after the server rejected it;
+# under heavy concurrent use a just-refreshed state can expire again before the retry
+FORM_STATE_RETRIES = 2
+
+# Hidden ASP.NET fields that have to be posted back with every search
+FORM_STATE_FIELDS = ("__EVENTTARGET", "__EVENTARGUMENT", "__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION")
+
+INPUT_TAG_RE = re.compile(r"<input\b[^>]*>", re.IGNORECASE)
+ATTRIBUTE_RE = re.compile(r"""([\w:-]+)\s*=\s*(["'])(.*?)\2""", re.DOTALL)
+
+# Just enough of HTML to walk the rows of the results table
+TABLE_START_RE = re.compile(r"<table\b", re.IGNORECASE)
+TABLE_END_RE = re.compile(r"</table\s*>", re.IGNORECASE)
+ROW_RE = re.compile(r"<tr\b.*?</tr\s*>", re.IGNORECASE | re.DOTALL)
+CELL_RE = re.compile(r"<td\b[^>]*>(.*?)</td\s*>", re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r"<[^>]*>")
+
+# Shared ResponseCache and PCSOSearchClient, created on first use
+_response_cache = None
+_search_client = None
+
+
+class FetchError(Exception):
+    """PCSO results could not be fetched"""
+
+
+class FetchTimeoutError(FetchError):
+    """PCSO did not answer in time, even after retrying"""
+
+
+class FetchConnectionError(FetchError):
+    """No connection to PCSO could be made, even after retrying"""
+
+
+class FetchHTTPError(FetchError):
+    """PCSO answered with an HTTP error status"""
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FetchFormError(FetchError):
+    """The PCSO search page did not look like expected"""
+
+
 def fetch_latest_winning_numbers(lottery_type, from_date, to_date):
-    base_url = "https://www.pcso.gov.ph/SearchLottoResult.aspx"
+    """
+    Search PCSO for a game's draws between two MM/DD/YYYY dates.
+
+    The search itself happens right away; the draws on the page are parsed
+    as the returned iterator is consumed.
+
+    Returns:
+        iterator: (draw_date, numbers) for every draw of the game in the range
+
+    Raises:
+        FetchError: If the results could not be fetched
+    """
+    return search_winning_numbers(lottery_type, from_date, to_date)
+
+
+def search_winning_numbers(lottery_type, from_date, to_date, use_cache=True):
+    """
+    Like fetch_latest_winning_numbers, with control over caching.
+
+    Args:
+        use_cache (bool): Whether to answer from / store into the response cache
+    """
+    lottery_type_int = ALL_GAMES_ID if lottery_type == "All Games" else get_game(lottery_type).game_id
+    html = search_page(lottery_type_int, from_date, to_date, use_cache)
+    return iter_results(html, lottery_type)
+
+
+def search_all_games(from_date, to_date, use_cache=True):
+    """
+    Fetch the draws of every game between two MM/DD/YYYY dates with a single "All Games" search.
+
+    Returns:
+        dict: Game name -> list of (draw_date, numbers), for each game in Games.GAMES
+
+    Raises:
+        FetchError: If the results could not be fetched
+    """
+    html = search_page(ALL_GAMES_ID, from_date, to_date, use_cache)
+    results = {name: [] for name in GAMES}
+    for name, draw_date, winning_numbers in iter_all_results(html):
+        results[name].append((draw_date, winning_numbers))
+    return results
+
+
+def search_page(lottery_type_int, from_date, to_date, use_cache=True):
+    """The HTML of a PCSO search, from the response cache when it is still good"""
+    cache_key = (lottery_type_int, search_date_key(from_date), search_date_key(to_date))
+
+    cache = get_response_cache() if use_cache else None
+    cached = cache.get(*cache_key) if cache else None
+    if cached and not has_results_table(cached.body):
+        # Left over from before only results pages were cached
+        cached = None
+
+    if cached and cached.is_fresh(cache.ttl):
+        return cached.body
+
+    response = post_search(lottery_type_int, from_date, to_date, cached.validator_headers() if cached else {})
+    if cached and response.status_code == 304:
+        # Nothing changed since the cached copy
+        cache.touch(*cache_key)
+        return cached.body
+
+    if cache and has_results_table(response.text):
+        # A range that ended before today can't get new draws, so an error or
+        # maintenance page must never be cached as its answer
+        immutable = date.fromisoformat(cache_key[2]) < date.today()
+        cache.put(*cache_key, response.text, immutable,
+                  response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return response.text
 
-    start_month, start_day, start_year = from_date.split('/')
-    end_month, end_day, end_year = to_date.split('/')
 
-    start_day = str(int(start_day))  
-    start_year = str(int(start_year))  
-    end_day = str(int(end_day))  
-    end_year = str(int(end_year))  
+def search_date_key(search_date):
+    """MM/DD/YYYY as YYYY-MM-DD, so equal dates always make the same cache key"""
+    month, day, year = search_date.split('/')
+    return f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
 
-    start_month_name = MONTH_MAP[start_month]
-    end_month_name = MONTH_MAP[end_month]
 
-    lottery_type_int = LOTTERY_TYPE_MAP.get(lottery_type, "0")
+def get_response_cache():
+    """The shared on-disk response cache, opened on first use"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
 
+
+def post_search(lottery_type_int, from_date, to_date, extra_headers):
+    """Run the PCSO search form through the shared client and return the raw response"""
+    return get_search_client().search(lottery_type_int, from_date, to_date, extra_headers)
+
+
+def get_search_client():
+    """The shared PCSOSearchClient, created on first use"""
+    global _search_client
+    if _search_client is None:
+        _search_client = PCSOSearchClient(os.environ.get(BASE_URL_ENV) or BASE_URL)
+    return _search_client
+
+
+class PCSOSearchClient:
+    """
+    Long-lived client for PCSO's ASP.NET search form.
+
+    The hidden form fields (__VIEWSTATE, __EVENTVALIDATION, ...) are fetched
+    once and reused for every search, together with the session cookie.
+    They are only fetched again when the server rejects them.
+    """
+
+    # Phrases ASP.NET answers with when the posted form state is no longer accepted
+    REJECTION_MARKERS = (
+        "Validation of viewstate MAC failed",
+        "The state information is invalid",
+        "Invalid postback or callback argument",
+    )
+
+    def __init__(self, base_url=BASE_URL, session=None, timeout=TIMEOUT, max_retries=MAX_RETRIES,
+                 backoff_base=BACKOFF_BASE):
+        self.base_url = base_url
+        self.session = session or create_session()
+        self.session.headers.update(HEADERS)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.form_state = None
+        self.lock = threading.Lock()
+        # Retried requests and form state refreshes so far, for diagnostics and load tests
+        self.retries = 0
+        self.refreshes = 0
+        self.stats_lock = threading.Lock()
+
+    def request(self, method, **kwargs):
+        """
+        Send a request with the client's timeouts, retrying transient failures.
+
+        Connection errors, timeouts and RETRY_STATUSES are retried up to
+        max_retries times with exponential backoff and full jitter.
+
+        Raises:
+            FetchTimeoutError, FetchConnectionError, FetchHTTPError: Once retrying doesn't help
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, self.base_url, timeout=self.timeout, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = retry_after(response)
+            except requests.Timeout as e:
+                if attempt >= self.max_retries:
+                    raise FetchTimeoutError(f"PCSO timed out after {attempt + 1} attempt(s): {e}") from e
+                delay = None
+            except requests.ConnectionError as e:
+                if attempt >= self.max_retries:
+                    raise FetchConnectionError(f"Could not connect to PCSO after {attempt + 1} attempt(s): {e}") from e
+                delay = None
+            except requests.RequestException as e:
+                raise FetchError(f"Request to PCSO failed: {e}") from e
+
+            if delay is None:
+                delay = random.uniform(0, min(BACKOFF_CAP, self.backoff_base * 2 ** attempt))
+            attempt += 1
+            with self.stats_lock:
+                self.retries += 1
+            time.sleep(delay)
+
+    def get_form_state(self, stale=None):
+        """
+        The cached hidden form fields, fetched from the search page if needed.
+
+        Args:
+            stale (dict): Form state the server just rejected. It is only replaced if it
+                          is still the cached one, so threads that all saw the same
+                          rejection share a single refresh.
+        """
+        with self.lock:
+            if self.form_state is None or (stale is not None and self.form_state is stale):
+                response = self.request("GET")
+                check_status(response)
+                self.form_state = parse_form_state(response.text)
+                if stale is not None:
+                    with self.stats_lock:
+                        self.refreshes += 1
+            return self.form_state
+
+    def is_rejected(self, response):
+        """
+        Whether the server refused the form state that was posted.
+
+        Only ASP.NET's ViewState / event validation errors count. Other server
+        errors were already retried by request() and are left to check_status.
+        """
+        return any(marker in response.text for marker in self.REJECTION_MARKERS)
+
+    def search(self, lottery_type_int, from_date, to_date, extra_headers=None):
+        """Post a search and return the raw response"""
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        headers.update(extra_headers or {})
+
+        fields = search_fields(lottery_type_int, from_date, to_date)
+        form_state = self.get_form_state()
+        response = self.request("POST", data=dict(form_state, **fields), headers=headers)
+
+        for _ in range(FORM_STATE_RETRIES):
+            if not self.is_rejected(response):
+                break
+            # The form state expired: fetch a fresh one (unless another thread just did) and try again
+            form_state = self.get_form_state(stale=form_state)
+            response = self.request("POST", data=dict(form_state, **fields), headers=headers)
+
+        check_status(response)
+        return response
+
+
+def create_session():
+    """A requests session that keeps a pool of connections to PCSO alive between searches"""
     session = requests.Session()
-    response = session.get(base_url)
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Extract hidden form fields
-    viewstate = soup.find("input", {"name": "__VIEWSTATE"})["value"]
-    eventvalidation = soup.find("input", {"name": "__EVENTVALIDATION"})["value"]
-    viewstategenerator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})["value"]
-    event_target = soup.find("input", {"name": "__EVENTTARGET"})
-    event_argument = soup.find("input", {"name": "__EVENTARGUMENT"})
-
-    # Define POST payload (data from the website)
-    payload = {
-        "__EVENTTARGET": event_target,
-        "__EVENTARGUMENT": event_argument,
-        "__VIEWSTATE": viewstate,
-        "__VIEWSTATEGENERATOR": viewstategenerator,
-        "__EVENTVALIDATION": eventvalidation,
-        "ctl00$ctl00$cphContainer$cpContent$ddlStartMonth": start_month_name,
-        "ctl00$ctl00$cphContainer$cpContent$ddlStartDate": start_day,
-        "ctl00$ctl00$cphContainer$cpContent$ddlStartYear": start_year,
-        "ctl00$ctl00$cphContainer$cpContent$ddlEndMonth": end_month_name,
-        "ctl00$ctl00$cphContainer$cpContent$ddlEndDay": end_day,
-        "ctl00$ctl00$cphContainer$cpContent$ddlEndYear": end_year,
+    adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def retry_after(response):
+    """Seconds the server asked us to wait in a Retry-After header, or None"""
+    value = response.headers.get("Retry-After", "")
+    return min(float(value), BACKOFF_CAP) if value.isdigit() else None
+
+
+def check_status(response):
+    """Raise FetchHTTPError for 4xx/5xx responses"""
+    if response.status_code >= 400:
+        raise FetchHTTPError(f"PCSO answered {response.status_code} {response.reason}", response.status_code)
+
+
+def parse_form_state(html):
+    """
+    Pull the ASP.NET hidden fields out of the search page.
+
+    Only the <input> tags are looked at, so the rest of the page is never parsed.
+    """
+    state = {}
+    for tag in INPUT_TAG_RE.findall(html):
+        attributes = dict((name.lower(), value) for name, _, value in ATTRIBUTE_RE.findall(tag))
+        name = attributes.get("name", "")
+        if name in FORM_STATE_FIELDS:
+            state[name] = unescape(attributes.get("value", ""))
+
+    if "__VIEWSTATE" not in state:
+        raise FetchFormError("PCSO search page has no __VIEWSTATE field")
+    return state
+
+
+def search_fields(lottery_type_int, from_date, to_date):
+    """The visible search form fields for a game and MM/DD/YYYY date range"""
+    start_month, start_day, start_year = from_date.split('/')
+    end_month, end_day, end_year = to_date.split('/')
+
+    return {
+        "ctl00$ctl00$cphContainer$cpContent$ddlStartMonth": MONTH_MAP[start_month],
+        "ctl00$ctl00$cphContainer$cpContent$ddlStartDate": str(int(start_day)),
+        "ctl00$ctl00$cphContainer$cpContent$ddlStartYear": str(int(start_year)),
+        "ctl00$ctl00$cphContainer$cpContent$ddlEndMonth": MONTH_MAP[end_month],
+        "ctl00$ctl00$cphContainer$cpContent$ddlEndDay": str(int(end_day)),
+        "ctl00$ctl00$cphContainer$cpContent$ddlEndYear": str(int(end_year)),
         "ctl00$ctl00$cphContainer$cpContent$ddlSelectGame": lottery_type_int,
         "ctl00$ctl00$cphContainer$cpContent$btnSearch": "Search Lotto"
     }
 
-    # Simulate a browser request (important for some sites)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
-    session.cookies.update(response.cookies)
 
-    try:
-        response = session.post(base_url, data=payload, headers=headers, timeout=10)
-        response.raise_for_status()
+def has_results_table(html):
+    """Whether a page has a table for iter_table_rows to read"""
+    return TABLE_START_RE.search(html) is not None
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
 
-        results = []
-        if not table:
-            return []
+def iter_table_rows(html):
+    """
+    Yield the cell texts of each row of the first table in a page.
 
-        for row in table.find_all("tr"):
-            cols = row.find_all("td")
-            if len(cols) < 4:
-                continue
+    Only the table is scanned, with a few regexes, so no document tree is
+    built and the (large) rest of the page is skipped. Header rows, which
+    have no <td> cells, are left out.
 
-            draw_date = cols[2].get_text(strip=True)
-            game_type = cols[0].get_text(strip=True)
-            if lottery_type in game_type:
-                winning_numbers = [num.zfill(2) for num in cols[1].get_text(strip=True).split('-') if num.isdigit()]
-                if winning_numbers:
-                    results.append((draw_date, winning_numbers))
+    Raises:
+        FetchFormError: If the page has no table, e.g. an error or maintenance page
+    """
+    start = TABLE_START_RE.search(html)
+    if not start:
+        raise FetchFormError("PCSO results page has no results table")
+    end = TABLE_END_RE.search(html, start.end())
+    end = end.start() if end else len(html)
 
-                if len(results) >= 15:
-                    break
+    for row in ROW_RE.finditer(html, start.start(), end):
+        cells = CELL_RE.findall(row.group())
+        if cells:
+            yield [unescape(TAG_RE.sub("", cell)).strip() for cell in cells]
 
-    except requests.RequestException as e:
-        print(f"Error fetching results: {e}")
-        return []
 
-    return results
+def iter_results(html, lottery_type):
+    """Yield (draw_date, numbers) for each draw of a game on a PCSO results page, in page order"""
+    # Rows are matched through the game registry, exactly like iter_all_results does
+    wanted = None if lottery_type == "All Games" else get_game(lottery_type).name
+    for name, draw_date, winning_numbers in iter_all_results(html):
+        if wanted is None or name == wanted:
+            yield draw_date, winning_numbers
+
+
+def iter_all_results(html):
+    """
+    Yield (game name, draw_date, numbers) for each draw on a PCSO results page.
+
+    Rows of games that aren't in Games.GAMES (the digit games on an
+    "All Games" page) are skipped.
+    """
+    for cols in iter_table_rows(html):
+        if len(cols) < 4:
+            continue
+
+        try:
+            game = get_game(cols[0])
+        except KeyError:
+            continue
+
+        winning_numbers = [num.zfill(2) for num in cols[1].split('-') if num.isdigit()]
+        if winning_numbers:
+            yield game.name, cols[2], winning_numbers
+
+
+def parse_results_page(html, lottery_type, limit=None):
+    """Pull (draw_date, numbers) rows of a game out of a PCSO results page, at most `limit` of them"""
+    return list(islice(iter_results(html, lottery_type), limit))
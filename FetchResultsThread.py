@@ -1,10 +1,30 @@
 from PyQt5.QtCore import pyqtSignal, QThread
 
-from FetchLatest import fetch_latest_winning_numbers
+from DrawArchive import DrawArchive
+from FetchLatest import FetchConnectionError, FetchError, FetchFormError, FetchHTTPError, FetchTimeoutError
+from Games import GAMES
+
+
+def fetch_error_message(error):
+    """What to tell the user about a failed PCSO fetch, depending on what went wrong"""
+    if isinstance(error, FetchConnectionError):
+        advice = "Could not connect to PCSO. Check your connection and try again."
+    elif isinstance(error, FetchTimeoutError):
+        advice = "PCSO is taking too long to answer. Try again in a few minutes."
+    elif isinstance(error, FetchHTTPError) and error.status_code == 429:
+        advice = "PCSO is getting too many requests. Wait a minute and try again."
+    elif isinstance(error, FetchHTTPError) and error.status_code >= 500:
+        advice = "The PCSO website is having problems. Try again later."
+    elif isinstance(error, FetchFormError):
+        advice = "The PCSO website sent an unexpected page; it may be under maintenance. Try again later."
+    else:
+        advice = "PCSO did not accept the search. Try again later."
+    return f"Could not fetch results. {advice}\n\n{error}"
 
 
 class FetchResultsThread(QThread):
     results_fetched = pyqtSignal(list)
+    fetch_failed = pyqtSignal(str)  # Emitted before results_fetched when results couldn't be fetched or read
     
     def __init__(self, lottery_type, lucky_numbers, from_date, to_date):
         super().__init__()
@@ -12,21 +32,52 @@ class FetchResultsThread(QThread):
         self.lucky_numbers = lucky_numbers
         self.from_date = from_date
         self.to_date = to_date
+        self.request = (lottery_type, from_date, to_date)
+
+    def cancel(self):
+        """Ask the fetch to stop; a cancelled fetch emits nothing"""
+        self.requestInterruption()
     
     def run(self):
         try:
-            recent_results = fetch_latest_winning_numbers(self.lottery_type, self.from_date, self.to_date)
+            archive = DrawArchive()
+
+            # Only dates the archive doesn't have yet go to PCSO, in one search for every game,
+            # so switching games afterwards is answered from the archive
+            try:
+                archive.sync_all(self.from_date, self.to_date)
+            except FetchError as e:
+                # Offline or PCSO is down: show what the archive already has
+                print(f"Error syncing results: {e}")
+                if not self.isInterruptionRequested():
+                    self.fetch_failed.emit(fetch_error_message(e))
+            except Exception as e:
+                # E.g. a draw date PCSO wrote in a new way, or a database error: still show the archive
+                print(f"Error storing results: {e}")
+                if not self.isInterruptionRequested():
+                    self.fetch_failed.emit(f"Could not update the saved results: {e}")
+
+            # A search already sent can't be taken back, but what it stored is still useful
+            if self.isInterruptionRequested():
+                return
+
+            recent_results = archive.draws(self.lottery_type, self.from_date, self.to_date)
+            pick = GAMES[self.lottery_type].pick
             table_data = []
             for draw_date, res in recent_results:
-                # Make sure we have exactly 6 numbers (pad if necessary)
-                numbers = res[:6]
-                while len(numbers) < 6:
+                # Make sure we have exactly as many numbers as the game picks (pad if necessary)
+                numbers = res[:pick]
+                while len(numbers) < pick:
                     numbers.append("")
                 
                 row = [draw_date] + numbers
                 table_data.append(row)
         except Exception as e:
+            # Never hand back an empty list without saying why
             print(f"Error fetching results: {e}")
+            if not self.isInterruptionRequested():
+                self.fetch_failed.emit(f"Could not read the saved results: {e}")
             table_data = []
         
-        self.results_fetched.emit(table_data)
\ No newline at end of file
+        if not self.isInterruptionRequested():
+            self.results_fetched.emit(table_data)
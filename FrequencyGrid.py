@@ -0,0 +1,115 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRect, QRectF, QSize
+from PyQt5.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen
+
+# Cell layout, matching the look of the old per-number QFrame boxes
+COLUMNS = 10
+CELL_SIZE = 60
+CELL_SPACING = 10
+CELL_RADIUS = 10
+MARGIN = 10
+NUMBER_HEIGHT = 30
+
+
+class FrequencyGrid(QWidget):
+    """
+    Heatmap of how often each number was drawn, painted as one widget.
+
+    Counts are kept in a plain list; set_frequencies compares them with the
+    new ones and only asks Qt to repaint the cells that actually changed.
+    """
+
+    def __init__(self, min_num, max_num, parent=None):
+        super().__init__(parent)
+        self.number_font = QFont("Roboto", 16, QFont.Bold)
+        self.frequency_font = QFont("Roboto", 12)
+        self.cell_color = QColor(55, 55, 150, 127)
+        self.cell_border = QPen(QColor(255, 255, 255, 25), 1)
+        self.top_border = QPen(Qt.white, 2)
+
+        self.min_num = min_num
+        self.max_num = max_num
+        self.counts = []
+        self.top = set()
+        self.set_range(min_num, max_num)
+
+    def set_range(self, min_num, max_num):
+        """Show the numbers of another game, all with a count of zero"""
+        self.min_num = min_num
+        self.max_num = max_num
+        self.counts = [0] * (max_num - min_num + 1)
+        self.top = set()
+        self.setMinimumSize(self.sizeHint())
+        self.updateGeometry()
+        self.update()
+
+    def set_frequencies(self, frequencies, top=()):
+        """
+        Show new counts (indexed by number) and highlight the given top numbers.
+
+        Only cells whose count or highlight changed are repainted.
+        """
+        top = set(top)
+        for num in range(self.min_num, self.max_num + 1):
+            count = int(frequencies[num]) if num < len(frequencies) else 0
+            i = num - self.min_num
+            if count != self.counts[i] or (num in top) != (num in self.top):
+                self.counts[i] = count
+                self.update(self.cell_rect(num).adjusted(-1, -1, 1, 1))
+        self.top = top
+
+    def frequency_data(self):
+        """The counts as (number, frequency) string pairs for export"""
+        return [(str(num), str(count)) for num, count in enumerate(self.counts, start=self.min_num)]
+
+    def rows(self):
+        return (self.max_num - self.min_num) // COLUMNS + 1
+
+    def sizeHint(self):
+        step = CELL_SIZE + CELL_SPACING
+        return QSize(MARGIN * 2 + COLUMNS * step - CELL_SPACING, MARGIN * 2 + self.rows() * step - CELL_SPACING)
+
+    def cell_rect(self, num):
+        """Where a number's cell is painted; the grid starts at min_num and is centered horizontally"""
+        row, col = divmod(num - self.min_num, COLUMNS)
+        step = CELL_SIZE + CELL_SPACING
+        left = max(MARGIN, (self.width() - self.sizeHint().width()) // 2 + MARGIN)
+        return QRect(left + col * step, MARGIN + row * step, CELL_SIZE, CELL_SIZE)
+
+    def resizeEvent(self, event):
+        # The grid is re-centered, so every cell moves
+        self.update()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        dirty = event.rect()
+
+        for num in range(self.min_num, self.max_num + 1):
+            rect = self.cell_rect(num)
+            if not rect.intersects(dirty):
+                continue
+            is_top = num in self.top
+
+            # The most frequent numbers are highlighted like the app's buttons
+            border = self.top_border if is_top else self.cell_border
+            inset = border.widthF() / 2
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(rect).adjusted(inset, inset, -inset, -inset), CELL_RADIUS, CELL_RADIUS)
+            if is_top:
+                gradient = QLinearGradient(rect.topLeft(), rect.topRight())
+                gradient.setColorAt(0, QColor(255, 210, 80, 229))
+                gradient.setColorAt(1, QColor(245, 115, 35, 229))
+                painter.fillPath(path, gradient)
+            else:
+                painter.fillPath(path, self.cell_color)
+            painter.strokePath(path, border)
+
+            # Number on top, its frequency below
+            painter.setPen(Qt.white)
+            painter.setFont(self.number_font)
+            painter.drawText(QRect(rect.x(), rect.y() + 4, rect.width(), NUMBER_HEIGHT), Qt.AlignCenter, str(num))
+            painter.setFont(self.frequency_font)
+            painter.drawText(QRect(rect.x(), rect.y() + 4 + NUMBER_HEIGHT, rect.width(), rect.height() - NUMBER_HEIGHT - 8),
+                             Qt.AlignCenter, str(self.counts[num - self.min_num]))
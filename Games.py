@@ -0,0 +1,93 @@
+from Combinatorics import binomial_rows, rank_combination, unrank_combination
+
+
+class Game:
+    """
+    One lottery game: its number range, PCSO game id and how many numbers are picked.
+
+    The combinatorics tables are built on first use and shared by every caller
+    through the caches in Combinatorics and TicketEngine.
+    """
+
+    def __init__(self, name, min_num, max_num, game_id, pick=6, aliases=()):
+        self.name = name
+        self.min_num = min_num
+        self.max_num = max_num
+        self.game_id = game_id
+        self.pick = pick
+        self.aliases = tuple(aliases)
+
+    def __repr__(self):
+        return f"Game({self.name!r})"
+
+    @property
+    def pool_size(self):
+        return self.max_num - self.min_num + 1
+
+    @property
+    def total_combinations(self):
+        return self.binomial_rows[self.pool_size][self.pick]
+
+    @property
+    def binomial_rows(self):
+        """Python table of C(c, i) for c <= pool_size and i <= pick"""
+        return binomial_rows(self.pool_size, self.pick)
+
+    @property
+    def binomial_table(self):
+        """The same table as a read-only numpy array, for vectorized code"""
+        # Imported here so Qt-free scripts that only need the registry don't load numpy
+        from TicketEngine import binomial_table
+        return binomial_table(self.pool_size, self.pick)
+
+    def rank(self, numbers):
+        """Rank of a ticket among all of the game's combinations, in [0, total_combinations)"""
+        return rank_combination([int(num) - self.min_num for num in numbers], self.pool_size, self.pick)
+
+    def unrank(self, rank):
+        """The ticket with the given rank, as ascending numbers"""
+        return tuple(num + self.min_num for num in unrank_combination(rank, self.pool_size, self.pick))
+
+    def match_probability(self, matches):
+        """Odds that a single ticket shares exactly `matches` numbers with a draw"""
+        rows = self.binomial_rows
+        misses = self.pick - matches
+        return rows[self.pick][matches] * rows[self.pool_size - self.pick][misses] / self.total_combinations
+
+
+# Search id PCSO uses for "All Games"
+ALL_GAMES_ID = "0"
+
+# Every supported game, largest first. Names match the game column of PCSO's results table.
+GAMES = {
+    game.name: game for game in (
+        Game("Ultra Lotto 6/58", 1, 58, "18"),
+        Game("Grand Lotto 6/55", 1, 55, "17"),
+        Game("Superlotto 6/49", 1, 49, "1", aliases=("Super Lotto 6/49",)),
+        Game("Megalotto 6/45", 1, 45, "2", aliases=("Mega Lotto 6/45",)),
+        Game("Lotto 6/42", 1, 42, "13"),
+    )
+}
+
+_GAMES_BY_ALIAS = {alias.lower(): game for game in GAMES.values() for alias in (game.name,) + game.aliases}
+
+
+def get_game(name):
+    """
+    Look up a game by name or alias, ignoring case.
+
+    Raises:
+        KeyError: If no game has that name
+    """
+    try:
+        return _GAMES_BY_ALIAS[name.strip().lower()]
+    except KeyError:
+        raise KeyError(f"Unknown lottery game: {name}") from None
+
+
+# Number range of every game, for code that only needs (min, max)
+LOTTERY_CONFIG = {name: (game.min_num, game.max_num) for name, game in GAMES.items()}
+
+# PCSO search id of every game, including the "All Games" search
+LOTTERY_TYPE_MAP = {"All Games": ALL_GAMES_ID}
+LOTTERY_TYPE_MAP.update({name: game.game_id for name, game in GAMES.items()})
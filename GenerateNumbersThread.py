@@ -0,0 +1,52 @@
+import time
+from contextlib import closing
+
+from PyQt5.QtCore import pyqtSignal, QThread
+
+from TicketEngine import stream_parallel_frequencies, lucky_numbers, default_workers, new_seed
+
+# Minimum seconds between partial frequency updates sent to the GUI
+UPDATE_INTERVAL = 0.1
+
+
+class GenerateNumbersThread(QThread):
+    progress = pyqtSignal(int, int)  # samples done, sample size
+    frequencies_updated = pyqtSignal(str, object)  # lottery type, partial frequencies
+    numbers_generated = pyqtSignal(str, list, object)  # lottery type, lucky numbers, frequencies
+
+    def __init__(self, lottery_type, min_num, max_num, sample_size=1000, seed=None, workers=None, pick=6):
+        super().__init__()
+        self.lottery_type = lottery_type
+        self.min_num = min_num
+        self.max_num = max_num
+        self.pick = pick  # Numbers per ticket, and lucky numbers picked
+        self.sample_size = sample_size
+        # The same seed and worker count always give the same frequencies
+        self.seed = seed if seed is not None else new_seed()
+        self.workers = workers if workers is not None else default_workers(sample_size)
+
+    def cancel(self):
+        """Ask the running generation to stop after the current task"""
+        self.requestInterruption()
+
+    def run(self):
+        self.progress.emit(0, self.sample_size)
+        last_update = time.monotonic()
+
+        frequencies = None
+        stream = stream_parallel_frequencies(self.min_num, self.max_num, self.sample_size, self.seed, self.workers,
+                                             self.pick)
+        with closing(stream):
+            for done, frequencies in stream:
+                if self.isInterruptionRequested():
+                    return
+
+                self.progress.emit(done, self.sample_size)
+
+                # Throttle partial results so huge samples don't flood the event loop
+                now = time.monotonic()
+                if done < self.sample_size and now - last_update >= UPDATE_INTERVAL:
+                    self.frequencies_updated.emit(self.lottery_type, frequencies.copy())
+                    last_update = now
+
+        self.numbers_generated.emit(self.lottery_type, lucky_numbers(frequencies, self.min_num, self.pick), frequencies)
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+from SQLiteStore import SQLiteStore
+
+
+class HistoryEntry:
+    """One generation: its game, lucky numbers and everything needed to replay it"""
+
+    __slots__ = ("entry_id", "lottery_type", "numbers", "seed", "sample_size", "workers", "generated_at")
+
+    def __init__(self, entry_id, lottery_type, numbers, seed, sample_size, workers, generated_at):
+        self.entry_id = entry_id
+        self.lottery_type = lottery_type
+        self.numbers = numbers
+        self.seed = seed
+        self.sample_size = sample_size
+        self.workers = workers
+        self.generated_at = generated_at
+
+
+class HistoryStore(SQLiteStore):
+    """
+    On-disk history of generated lucky numbers, newest first.
+
+    Entries are only read back a page at a time, so the history can grow
+    without the app holding all of it in memory.
+    """
+
+    FILENAME = "history.sqlite3"
+
+    def __init__(self, path=None):
+        super().__init__(path)
+        with self.connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    lottery_type TEXT NOT NULL,
+                    numbers TEXT NOT NULL,
+                    seed TEXT NOT NULL,
+                    sample_size INTEGER NOT NULL,
+                    workers INTEGER NOT NULL,
+                    generated_at TEXT NOT NULL
+                )
+            """)
+
+    def add(self, lottery_type, numbers, seed, sample_size, workers):
+        """
+        Store a generation.
+
+        Returns:
+            HistoryEntry: The stored entry
+        """
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.connect() as conn:
+            # Seeds are 64-bit and unsigned, which SQLite integers can't hold, so they are kept as text
+            cursor = conn.execute(
+                "INSERT INTO history (lottery_type, numbers, seed, sample_size, workers, generated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (lottery_type, "-".join(numbers), str(seed), sample_size, workers, generated_at)
+            )
+        return HistoryEntry(cursor.lastrowid, lottery_type, list(numbers), seed, sample_size, workers, generated_at)
+
+    def count(self):
+        with self.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def page(self, offset, limit):
+        """Up to `limit` entries starting `offset` entries from the newest"""
+        with self.connect() as conn:
+            rows = conn.execute(
+                "SELECT id, lottery_type, numbers, seed, sample_size, workers, generated_at FROM history "
+                "ORDER BY id DESC LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+        return [
+            HistoryEntry(entry_id, lottery_type, numbers.split("-"), int(seed), sample_size, workers, generated_at)
+            for entry_id, lottery_type, numbers, seed, sample_size, workers, generated_at in rows
+        ]
+
+    def export_rows(self):
+        """Yield every entry as a CSV export row, oldest first, without loading them all at once"""
+        with self.connect() as conn:
+            cursor = conn.execute(
+                "SELECT lottery_type, numbers, seed, sample_size, workers FROM history ORDER BY id"
+            )
+            for lottery_type, numbers, seed, sample_size, workers in cursor:
+                yield [lottery_type] + numbers.split("-") + [seed, str(sample_size), str(workers)]
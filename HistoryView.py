@@ -0,0 +1,171 @@
+import random
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QEvent, QModelIndex, QRect, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath
+
+from BallWidget import paint_ball
+from Cards import BALL_FONT_SIZE, BALL_SIZE, CARD_PADDING, CARD_SPACING, card_rect, paint_card_background
+
+# Entries read from the store at a time, and how many such pages stay in memory
+PAGE_SIZE = 50
+CACHED_PAGES = 4
+
+# Card layout, matching the look of the old per-entry QFrame cards
+TITLE_HEIGHT = 30
+FOOTER_HEIGHT = 28
+TIMESTAMP_HEIGHT = 18
+REPLAY_BUTTON_WIDTH = 80
+CARD_HEIGHT = (CARD_PADDING + TITLE_HEIGHT + CARD_PADDING + BALL_SIZE + CARD_PADDING
+               + FOOTER_HEIGHT + TIMESTAMP_HEIGHT + CARD_PADDING)
+
+
+class HistoryModel(QAbstractListModel):
+    """
+    Lucky number history, newest first, backed by a HistoryStore.
+
+    Only the pages around what the view asks for are held in memory (at most
+    CACHED_PAGES * PAGE_SIZE entries); the rest stays on disk until needed.
+    """
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.total = store.count()
+        self.pages = OrderedDict()  # Page number -> entries, least recently used first
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.total
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self.entry(index.row())
+
+    def entry(self, row):
+        """The HistoryEntry at a row, read from the store with the rest of its page if needed"""
+        number, offset = divmod(row, PAGE_SIZE)
+        page = self.pages.get(number)
+        if page is None:
+            page = self.store.page(number * PAGE_SIZE, PAGE_SIZE)
+            self.pages[number] = page
+            if len(self.pages) > CACHED_PAGES:
+                self.pages.popitem(last=False)
+        else:
+            self.pages.move_to_end(number)
+        return page[offset] if offset < len(page) else None
+
+    def add(self, lottery_type, numbers, seed, sample_size, workers):
+        """Store a new entry and show it at the top"""
+        entry = self.store.add(lottery_type, numbers, seed, sample_size, workers)
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self.total += 1
+        # Every row moved down by one, so the cached pages no longer line up
+        self.pages.clear()
+        self.endInsertRows()
+        return entry
+
+
+class HistoryCardDelegate(QStyledItemDelegate):
+    """Paints a history entry as a card with its balls, seed details and a Replay button"""
+
+    replay_requested = pyqtSignal(object)  # HistoryEntry
+
+    def __init__(self, asset_manager, parent=None):
+        super().__init__(parent)
+        self.asset_manager = asset_manager
+        self.title_font = QFont("Roboto", 16, QFont.Bold)
+        self.detail_font = QFont("Roboto Medium", 10)
+        self.button_font = QFont("Roboto Black", 9)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), CARD_HEIGHT + CARD_SPACING)
+
+    def replay_button_rect(self, option):
+        card = card_rect(option, CARD_HEIGHT)
+        top = card.y() + CARD_PADDING + TITLE_HEIGHT + CARD_PADDING + BALL_SIZE + CARD_PADDING
+        return QRect(card.right() - CARD_PADDING * 2 - REPLAY_BUTTON_WIDTH, top, REPLAY_BUTTON_WIDTH, FOOTER_HEIGHT)
+
+    def paint(self, painter, option, index):
+        entry = index.data()
+        if entry is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = paint_card_background(painter, option, CARD_HEIGHT)
+
+        # Lottery type
+        left = card.x() + CARD_PADDING * 2
+        width = card.width() - CARD_PADDING * 4
+        y = card.y() + CARD_PADDING
+        painter.setPen(Qt.white)
+        painter.setFont(self.title_font)
+        painter.drawText(QRect(left, y, width, TITLE_HEIGHT), Qt.AlignLeft | Qt.AlignVCenter,
+                         f"Lottery Game: {entry.lottery_type}")
+        y += TITLE_HEIGHT + CARD_PADDING
+
+        # Shuffle ball indices with the generation's own seed, so a replay shows the same balls
+        ball_indices = list(range(1, 7))
+        random.Random(entry.seed).shuffle(ball_indices)
+        x = card.x() + (card.width() - BALL_SIZE * len(entry.numbers)) // 2
+        for i, number in enumerate(entry.numbers):
+            paint_ball(painter, QRect(x, y, BALL_SIZE, BALL_SIZE), number, ball_indices[i % 6],
+                       self.asset_manager, BALL_FONT_SIZE)
+            x += BALL_SIZE
+        y += BALL_SIZE + CARD_PADDING
+
+        # Seed details with a button to regenerate this entry
+        painter.setFont(self.detail_font)
+        painter.setPen(QColor(255, 255, 255, 178))
+        painter.drawText(QRect(left, y, width - REPLAY_BUTTON_WIDTH, FOOTER_HEIGHT), Qt.AlignLeft | Qt.AlignVCenter,
+                         f"Seed: {entry.seed}  |  {entry.sample_size:,} combinations  |  {entry.workers} worker(s)")
+
+        button = self.replay_button_rect(option)
+        button_path = QPainterPath()
+        button_path.addRoundedRect(button.x(), button.y(), button.width(), button.height(), 10, 10)
+        painter.fillPath(button_path, QColor(55, 55, 150, 191))
+        painter.setPen(Qt.white)
+        painter.setFont(self.button_font)
+        painter.drawText(button, Qt.AlignCenter, "Replay")
+        y += FOOTER_HEIGHT
+
+        # Timestamp
+        painter.setFont(self.detail_font)
+        painter.setPen(QColor(255, 255, 255, 178))
+        painter.drawText(QRect(left, y, width, TIMESTAMP_HEIGHT), Qt.AlignRight | Qt.AlignVCenter,
+                         f"Generated: {entry.generated_at}")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        # The Replay button is only painted, so clicks on it are caught here
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if self.replay_button_rect(option).contains(event.pos()):
+                entry = index.data()
+                if entry is not None:
+                    self.replay_requested.emit(entry)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class HistoryView(QListView):
+    """List of history cards; only the rows on screen are painted or read from the store"""
+
+    def __init__(self, store, asset_manager, parent=None):
+        super().__init__(parent)
+        self.history_model = HistoryModel(store, self)
+        self.setModel(self.history_model)
+        self.delegate = HistoryCardDelegate(asset_manager, self)
+        self.setItemDelegate(self.delegate)
+        self.replay_requested = self.delegate.replay_requested
+
+        # Every card has the same height, so the view can skip measuring rows
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(30)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)  # For the hover highlight
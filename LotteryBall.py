@@ -1,10 +1,9 @@
-from itertools import combinations
 import random
+from collections import OrderedDict
 import Assets_rc
 from datetime import datetime
-from collections import Counter
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QComboBox, QDateEdit, QScrollArea, QGridLayout,
-                             QHBoxLayout, QPushButton, QLabel, QTableWidgetItem, QTableWidget,
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QComboBox, QDateEdit, QSpinBox, QScrollArea,
+                             QHBoxLayout, QPushButton, QLabel, QTableWidgetItem,
                              QFrame, QStackedWidget, QDesktopWidget, QMessageBox, QFileDialog)
 from PyQt5.QtCore import Qt, QTimer, QDate
 from PyQt5.QtGui import QPalette, QColor, QFont, QBrush, QIcon, QPixmap
@@ -12,18 +11,25 @@ from PyQt5.QtGui import QPalette, QColor, QFont, QBrush, QIcon, QPixmap
 from BallWidget import BallWidget
 from RoundWidget import RoundedWidget
 from CircleButtons import CircleButtonBack, CircleButtonInfo, CircleButtonNext, CircleButtonPrev
+from FrequencyGrid import FrequencyGrid
 from FetchResultsThread import FetchResultsThread
+from GenerateNumbersThread import GenerateNumbersThread
+from HistoryStore import HistoryStore
+from HistoryView import HistoryView
+from ResultsView import ResultsView
+from TicketEngine import lucky_numbers, new_seed, MIN_SAMPLE_SIZE, MAX_SAMPLE_SIZE
 
 
 from Export import export_data_to_csv
+from Games import GAMES, LOTTERY_CONFIG
 
-LOTTERY_CONFIG = {
-    "Ultra Lotto 6/58": (1, 58), 
-    "Grand Lotto 6/55": (1, 55), 
-    "Superlotto 6/49": (1, 49), 
-    "Megalotto 6/45": (1, 45), 
-    "Lotto 6/42": (1, 42)
-}
+# Quiet time (ms) after the last game/date change before results are fetched
+FETCH_DEBOUNCE_MS = 400
+
+# Quiet time (ms) after the last resize before the background is smooth-scaled,
+# and how many window sizes keep their smooth-scaled background
+BACKGROUND_SMOOTH_DELAY_MS = 150
+BACKGROUND_CACHE_SIZE = 4
 
 class LotteryBall(QMainWindow):
     def __init__(self, asset_manager):
@@ -33,6 +39,26 @@ class LotteryBall(QMainWindow):
         self.lottery_balls = []
         self.lucky_numbers = []
         self.selected_lottery_type = "Lotto 6/42"  # Default lottery type
+        self.generate_thread = None
+        self.replaying = False  # True while a history entry is being regenerated
+        self.history_store = HistoryStore()
+        self.fetch_error = None  # Why the last fetch failed, if it did
+
+        # Result fetches: only the newest one may update the results tab
+        self.fetch_results_thread = None
+        self.fetch_threads = set()  # Keeps superseded threads alive until they finish
+        self.fetch_timer = QTimer(self)
+        self.fetch_timer.setSingleShot(True)
+        self.fetch_timer.setInterval(FETCH_DEBOUNCE_MS)
+        self.fetch_timer.timeout.connect(self.fetch_selected_results)
+
+        # Background image: decoded once, smooth-scaled once resizing settles
+        self.background_source = QPixmap()
+        self.background_cache = OrderedDict()  # Window size -> smooth-scaled pixmap, least recently used first
+        self.background_timer = QTimer(self)
+        self.background_timer.setSingleShot(True)
+        self.background_timer.setInterval(BACKGROUND_SMOOTH_DELAY_MS)
+        self.background_timer.timeout.connect(self.update_background)
         
         self.initUI()
         icon_path = self.asset_manager.load_asset("Assets/Icons/app_icon.ico")
@@ -199,13 +225,24 @@ class LotteryBall(QMainWindow):
         lottery_game_label.setStyleSheet("color: #FFFFFF; background-color: rgba(145, 145, 220, 0)")
         control_layout.addWidget(lottery_game_label)
         
-        lottery_options = ["Lotto 6/42", "Megalotto 6/45", "Superlotto 6/49", "Grand Lotto 6/55", "Ultra Lotto 6/58"]
+        lottery_options = list(GAMES)[::-1]  # Smallest game first
         self.lottery_dropdown = self.create_dropdown_field(lottery_options)
         self.lottery_dropdown.currentIndexChanged.connect(self.on_lottery_selection_changed)
         control_layout.addWidget(self.lottery_dropdown)
 
         control_layout.addSpacing(15)
 
+        # Monte Carlo sample size
+        sample_size_label = QLabel("  Set Sample Size")
+        sample_size_label.setFont(QFont("Roboto", 18, QFont.Bold))
+        sample_size_label.setStyleSheet("color: #FFFFFF; background-color: rgba(145, 145, 220, 0)")
+        control_layout.addWidget(sample_size_label)
+
+        self.sample_size_spinbox = self.create_sample_size_field(1000)
+        control_layout.addWidget(self.sample_size_spinbox)
+
+        control_layout.addSpacing(15)
+
         # Results Date
         date_range_label = QLabel("  Set Results Date")
         date_range_label.setFont(QFont("Roboto", 18, QFont.Bold))
@@ -234,6 +271,10 @@ class LotteryBall(QMainWindow):
         to_layout.addWidget(self.to_date_edit)
         control_layout.addLayout(to_layout)
 
+        # Refetch once the user is done picking dates
+        self.from_date_edit.dateChanged.connect(self.schedule_fetch_results)
+        self.to_date_edit.dateChanged.connect(self.schedule_fetch_results)
+
         control_layout.addSpacing(15)
 
         # Add button to fetch results
@@ -289,34 +330,93 @@ class LotteryBall(QMainWindow):
 
         return control_panel
 
-    def on_lottery_selection_changed(self):
-        """Triggered when the lottery type selection changes"""
-        self.selected_lottery_type = self.lottery_dropdown.currentText()
-        self.check_and_fetch_results()
+    def schedule_fetch_results(self):
+        """Fetch results once the game and dates have stopped changing for FETCH_DEBOUNCE_MS"""
+        self.fetch_timer.start()
 
     def check_and_fetch_results(self):
-        """Check if the date range is valid and trigger fetching of results"""
+        """Fetch results right away, warning if the date range is invalid"""
+        self.fetch_timer.stop()
+        if not self.fetch_selected_results():
+            # Display a warning if the date range is invalid
+            QMessageBox.warning(self, "Invalid Date Range", "From date must not be later than To date.")
+
+    def fetch_selected_results(self):
+        """
+        Fetch results for the selected game and date range.
+
+        Returns:
+            bool: False if the From date is later than the To date
+        """
         from_date = self.from_date_edit.date()
         to_date = self.to_date_edit.date()
+        if from_date > to_date:
+            return False
 
-        # Check if the From date is earlier than the To date
-        if from_date <= to_date:
-            # Fetch results if the date range is valid
-            from_date_str = from_date.toString("MM/dd/yyyy")
-            to_date_str = to_date.toString("MM/dd/yyyy")
-            
-            # Start the fetch thread to get recent results
-            self.start_fetch_results_thread(self.selected_lottery_type, from_date_str, to_date_str)
-        else:
-            # Display a warning if the date range is invalid
-            QMessageBox.warning(self, "Invalid Date Range", "From date must not be later than To date.")
+        self.start_fetch_results_thread(self.selected_lottery_type,
+                                        from_date.toString("MM/dd/yyyy"), to_date.toString("MM/dd/yyyy"))
+        return True
 
     def start_fetch_results_thread(self, lottery_type, from_date, to_date):
-        """Start the thread to fetch lottery results"""
+        """
+        Start the thread to fetch lottery results.
+
+        A request identical to the one still running is dropped. Any other
+        running fetch is cancelled, and its results are ignored if it
+        finishes anyway, so only the newest request reaches the results tab.
+        """
+        current = self.fetch_results_thread
+        request = (lottery_type, from_date, to_date)
+        if current is not None and current.isRunning() and current.request == request:
+            return
+        if current is not None:
+            current.cancel()
+
+        self.fetch_error = None
         self.fetch_results_thread = FetchResultsThread(lottery_type, self.lucky_numbers, from_date, to_date)
-        self.fetch_results_thread.results_fetched.connect(self.display_recent_results)
+        self.fetch_results_thread.fetch_failed.connect(self.on_fetch_failed)
+        self.fetch_results_thread.results_fetched.connect(self.on_results_fetched)
+        self.fetch_results_thread.finished.connect(self.on_fetch_thread_finished)
+        self.fetch_threads.add(self.fetch_results_thread)
         self.fetch_results_thread.start()
+
+    def on_results_fetched(self, recent_results):
+        """Show results, unless a newer fetch has been started since"""
+        if self.sender() is self.fetch_results_thread:
+            self.display_recent_results(recent_results)
+
+    def on_fetch_thread_finished(self):
+        """Let go of a finished fetch thread"""
+        thread = self.sender()
+        self.fetch_threads.discard(thread)
+        thread.deleteLater()
+        if thread is self.fetch_results_thread:
+            self.fetch_results_thread = None
+
+    def on_fetch_failed(self, message):
+        """Remember the message for why the fetch failed, so the results tab can show it"""
+        if self.sender() is self.fetch_results_thread:
+            self.fetch_error = message
     
+    def set_ball_count(self, count):
+        """Show `count` placeholder balls, half on each row, if a different number is shown now"""
+        if len(self.lottery_balls) == count:
+            return
+
+        for ball in self.lottery_balls:
+            ball.deleteLater()
+        self.lottery_balls = []
+
+        ball_indices = list(range(1, 7))  # Initially from 1 to 6
+        random.shuffle(ball_indices)
+        for i in range(count):
+            ball = BallWidget("00", ball_indices[i % 6], asset_manager=self.asset_manager)  # placeholder value
+            self.lottery_balls.append(ball)
+            if i < (count + 1) // 2:
+                self.first_row_layout.addWidget(ball)
+            else:
+                self.second_row_layout.addWidget(ball)
+
     def update_lucky_label(self):
         # Check if any of the balls still have the default "00" number
         if any(ball.get_number() == "00" for ball in self.lottery_balls):
@@ -550,6 +650,37 @@ class LotteryBall(QMainWindow):
         """)
         return date_edit
 
+    def create_sample_size_field(self, value: int) -> QSpinBox:
+        spin_box = QSpinBox()
+        spin_box.setRange(MIN_SAMPLE_SIZE, MAX_SAMPLE_SIZE)
+        spin_box.setValue(value)
+        spin_box.setSingleStep(1000)
+        spin_box.setGroupSeparatorShown(True)
+        spin_box.setSuffix(" combinations")
+        spin_box.setMinimumHeight(40)
+
+        spin_box.setStyleSheet("""
+            QSpinBox {
+                border-radius: 10px;
+                padding: 8px 12px;
+                background-color: rgba(55, 55, 150, 0.75);
+                font-family: 'Roboto Medium';
+                font-size: 16px;
+                color: #FFFFFF;
+            }
+
+            QSpinBox:focus {
+                border: 2px solid #FFFFFF;
+                background-color: rgba(55, 55, 150, 0.25);
+            }
+
+            QSpinBox::up-button, QSpinBox::down-button {
+                width: 0px;
+                border: none;
+            }
+        """)
+        return spin_box
+
     def create_main_buttons_layout(self):
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(15)
@@ -637,9 +768,6 @@ class LotteryBall(QMainWindow):
     
     def create_stacked_widget(self):
         self.stacked_widget = QStackedWidget()
-        
-        # Initialize the number_labels dictionary
-        self.number_labels = {}
 
         # --------- Tab 1: Lucky Numbers ----------
         lucky_tab = RoundedWidget(radius=20)
@@ -656,19 +784,9 @@ class LotteryBall(QMainWindow):
         self.second_row_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
         lucky_layout.addLayout(self.second_row_layout)
 
-        # Create and store the ball widgets
+        # Create and store the ball widgets, one per number the game picks
         self.lottery_balls = []
-        ball_indices = list(range(1, 7))  # Initially from 1 to 6
-        random.shuffle(ball_indices)
-        default_numbers = ["00", "00", "00", "00", "00", "00"]  # placeholder values
-
-        for i in range(6):
-            ball = BallWidget(default_numbers[i], ball_indices[i], asset_manager=self.asset_manager)
-            self.lottery_balls.append(ball)
-            if i < 3:
-                self.first_row_layout.addWidget(ball)
-            else:
-                self.second_row_layout.addWidget(ball)
+        self.set_ball_count(GAMES[self.selected_lottery_type].pick)
 
         self.lucky_label = QLabel("IS YOUR LUCKY COMBINATION!")
         self.lucky_label.setAlignment(Qt.AlignCenter)
@@ -693,30 +811,23 @@ class LotteryBall(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setStyleSheet("background-color: transparent; border: none;")
         
-        # Create a container widget for the grid
-        self.grid_container = QWidget()
-        self.grid_container.setStyleSheet("background-color: transparent;")
+        # One widget paints every number box
+        min_num, max_num = LOTTERY_CONFIG[self.selected_lottery_type]
+        self.frequency_grid = FrequencyGrid(min_num, max_num)
         
-        # Create a grid layout for the frequency boxes
-        self.freq_grid = QGridLayout(self.grid_container)
-        self.freq_grid.setSpacing(10)
-        
-        # Set the grid container as the scroll area's widget
-        scroll_area.setWidget(self.grid_container)
+        # Set the grid as the scroll area's widget
+        scroll_area.setWidget(self.frequency_grid)
         
         # Add the scroll area to the frequency tab layout
         freq_layout.addWidget(scroll_area)
         
         # Add a label explaining the display
-        info_label = QLabel("Numbers are displayed with their frequency. Top 6 most frequent numbers are highlighted.")
+        info_label = QLabel("Numbers are displayed with their frequency. The most frequent numbers are highlighted.")
         info_label.setAlignment(Qt.AlignCenter)
         info_label.setFont(QFont("Roboto", 12))
         info_label.setStyleSheet("color: white; padding: 10px; background-color: rgba(55, 55, 150, 0);")
         freq_layout.addWidget(info_label)
         
-        # Initialize the frequency grid
-        self.update_frequency_grid()
-        
         self.stacked_widget.addWidget(freq_tab)
 
         # --------- Tab 3: Recent Lottery Results ----------
@@ -725,11 +836,16 @@ class LotteryBall(QMainWindow):
         recent_layout.setContentsMargins(15, 15, 15, 15)
         recent_layout.setSpacing(15)
 
-        # Create a scroll area for the results
-        results_scroll = QScrollArea()
-        results_scroll.setWidgetResizable(True)
-        results_scroll.setStyleSheet("""
-            QScrollArea {
+        # Message shown instead of, or above, the results
+        self.results_message_label = QLabel("No recent results available. Use the 'Get Recent Results' button to fetch data.")
+        self.results_message_label.setAlignment(Qt.AlignCenter)
+        self.results_message_label.setWordWrap(True)
+        recent_layout.addWidget(self.results_message_label)
+
+        # One list view for all draws: cards are painted by a delegate, only for the rows on screen
+        self.results_view = ResultsView(self.asset_manager)
+        self.results_view.setStyleSheet("""
+            QListView {
                 background-color: transparent;
                 border: none;
             }
@@ -747,27 +863,9 @@ class LotteryBall(QMainWindow):
                 height: 0px;
             }
         """)
-
-        # Create a container widget for the results
-        results_container = QWidget()
-        results_container.setStyleSheet("background-color: transparent;")
-        self.results_layout = QVBoxLayout(results_container)
-        self.results_layout.setSpacing(15)
-        self.results_layout.setContentsMargins(5, 5, 5, 5)
-
-        # Add a placeholder message when no results are available
-        self.no_results_label = QLabel("No recent results available. Use the 'Get Recent Results' button to fetch data.")
-        self.no_results_label.setAlignment(Qt.AlignCenter)
-        self.no_results_label.setFont(QFont("Roboto", 14))
-        self.no_results_label.setStyleSheet("color: rgba(255, 255, 255, 0.7); padding: 20px;")
-        self.no_results_label.setWordWrap(True)
-        self.results_layout.addWidget(self.no_results_label)
-
-        # Set the container as the scroll area's widget
-        results_scroll.setWidget(results_container)
-
-        # Add the scroll area to the tab layout
-        recent_layout.addWidget(results_scroll)
+        self.results_view.hide()
+        recent_layout.addWidget(self.results_view)
+        self.show_results_message(None)
 
         self.stacked_widget.addWidget(recent_tab)
 
@@ -777,11 +875,18 @@ class LotteryBall(QMainWindow):
         history_layout.setContentsMargins(15, 15, 15, 15)
         history_layout.setSpacing(15)
 
-        # Create a scroll area for the history
-        history_scroll = QScrollArea()
-        history_scroll.setWidgetResizable(True)
-        history_scroll.setStyleSheet("""
-            QScrollArea {
+        # Add a placeholder message when no history is available
+        self.no_history_label = QLabel("No history available. Generate lucky numbers to see them here.")
+        self.no_history_label.setAlignment(Qt.AlignCenter)
+        self.no_history_label.setFont(QFont("Roboto", 14))
+        self.no_history_label.setStyleSheet("color: rgba(255, 255, 255, 0.7); padding: 20px;")
+        self.no_history_label.setWordWrap(True)
+        history_layout.addWidget(self.no_history_label)
+
+        # History lives on disk; the view only reads and paints the entries on screen
+        self.history_view = HistoryView(self.history_store, self.asset_manager)
+        self.history_view.setStyleSheet("""
+            QListView {
                 background-color: transparent;
                 border: none;
             }
@@ -799,130 +904,27 @@ class LotteryBall(QMainWindow):
                 height: 0px;
             }
         """)
+        self.history_view.replay_requested.connect(
+            lambda entry: self.replay_generation(entry.lottery_type, entry.sample_size, entry.seed, entry.workers))
+        history_layout.addWidget(self.history_view)
 
-        # Create a container widget for the history
-        history_container = QWidget()
-        history_container.setStyleSheet("background-color: transparent;")
-        self.history_cards_layout = QVBoxLayout(history_container)
-        self.history_cards_layout.setSpacing(15)
-        self.history_cards_layout.setContentsMargins(5, 5, 5, 5)
-
-        # Add a placeholder message when no history is available
-        self.no_history_label = QLabel("No history available. Generate lucky numbers to see them here.")
-        self.no_history_label.setAlignment(Qt.AlignCenter)
-        self.no_history_label.setFont(QFont("Roboto", 14))
-        self.no_history_label.setStyleSheet("color: rgba(255, 255, 255, 0.7); padding: 20px;")
-        self.no_history_label.setWordWrap(True)
-        self.history_cards_layout.addWidget(self.no_history_label)
-
-        # Set the container as the scroll area's widget
-        history_scroll.setWidget(history_container)
-
-        # Add the scroll area to the tab layout
-        history_layout.addWidget(history_scroll)
-
-        # Create a hidden table for CSV export compatibility
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(7)
-        self.history_table.setHorizontalHeaderLabels(["Lotto Type", "1", "2", "3", "4", "5", "6"])
-        self.history_table.hide()  # Hide the table as we're using cards instead
+        has_history = self.history_view.model().rowCount() > 0
+        self.no_history_label.setVisible(not has_history)
+        self.history_view.setVisible(has_history)
 
         self.stacked_widget.addWidget(history_tab)
 
         return self.stacked_widget
     
-    def add_history(self, table, lottery_type, lucky_numbers, mirror_table=None):
-        """Add a new entry to the history table and the history cards layout"""
-        # Add to the hidden table for CSV export
-        row_count = table.rowCount()
-        table.insertRow(row_count)
-        table.setItem(row_count, 0, QTableWidgetItem(lottery_type))
-        for i, num in enumerate(lucky_numbers):
-            table.setItem(row_count, i + 1, QTableWidgetItem(num))
-
-        if mirror_table is not None:
-            mirror_row = mirror_table.rowCount()
-            mirror_table.insertRow(mirror_row)
-            mirror_table.setItem(mirror_row, 0, QTableWidgetItem(lottery_type))
-            for i, num in enumerate(lucky_numbers):
-                mirror_table.setItem(mirror_row, i + 1, QTableWidgetItem(num))
-        
+    def add_history(self, lottery_type, lucky_numbers, seed, sample_size, workers):
+        """Store a generation in the history and show it at the top of the history tab"""
+        # Everything needed to replay the generation is stored with its numbers
+        self.history_view.model().add(lottery_type, lucky_numbers, seed, sample_size, workers)
+        self.history_view.scrollToTop()
+
         # Remove the placeholder if it exists
-        if hasattr(self, 'no_history_label') and self.no_history_label.isVisible():
-            self.no_history_label.setVisible(False)
-        
-        # Create a card for the history entry
-        history_card = QFrame()
-        history_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                            stop: 0 rgba(55, 55, 150, 0.7),
-                            stop: 1 rgba(60, 85, 180, 0.7));
-                border-radius: 15px;
-                padding: 5px;
-            }
-            QFrame:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                            stop: 0 rgba(60, 85, 180, 0.8),
-                            stop: 1 rgba(70, 95, 200, 0.8));
-            }
-        """)
-        
-        card_layout = QVBoxLayout(history_card)
-        card_layout.setSpacing(10)
-        
-        # Lottery type
-        type_label = QLabel(f"Lottery Game: {lottery_type}")
-        type_label.setFont(QFont("Roboto", 16, QFont.Bold))
-        type_label.setStyleSheet("color: white; background: rgba(255, 255, 255, 0)")
-        type_label.setAlignment(Qt.AlignLeft)
-        card_layout.addWidget(type_label)
-        
-        # Numbers container
-        numbers_widget = QWidget()
-        numbers_layout = QHBoxLayout(numbers_widget)
-        numbers_layout.setSpacing(0)
-        numbers_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Generate random ball indices
-        # Method 1: Using a similar approach to display_recent_results
-        # Use a random seed based on the current time to ensure different randomization each time
-        random_seed = int(datetime.now().timestamp())
-        random.seed(random_seed)
-        
-        # Method 2: Shuffle a list of indices
-        ball_indices = list(range(1, 7))  # Indices 1-6
-        random.shuffle(ball_indices)
-        
-        # Add lottery balls for each number using BallWidget with custom size
-        for i, num in enumerate(lucky_numbers):
-            # Method 1: Generate a random index using a formula
-            # ball_index = (random_seed + i) % 6 + 1
-            
-            # Method 2: Use the shuffled indices
-            ball_index = ball_indices[i]
-            
-            # Create a BallWidget with custom size and font size
-            ball = BallWidget(num, ball_index, size=100, font_size=24, asset_manager=self.asset_manager)
-            
-            numbers_layout.addWidget(ball)
-
-        # Center the numbers
-        numbers_layout.addStretch()
-        numbers_layout.insertStretch(0)
-        
-        card_layout.addWidget(numbers_widget)
-        
-        # Add timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        time_label = QLabel(f"Generated: {timestamp}")
-        time_label.setFont(QFont("Roboto Medium", 10))
-        time_label.setStyleSheet("color: rgba(255, 255, 255, 0.7); background: rgba(255, 255, 255, 0)")
-        time_label.setAlignment(Qt.AlignRight)
-        card_layout.addWidget(time_label)
-        
-        # Add the card to the history layout at the top (newest first)
-        self.history_cards_layout.insertWidget(0, history_card)
+        self.no_history_label.setVisible(False)
+        self.history_view.setVisible(True)
 
     def show_next_tab(self):
         # Increment tab index and wrap around using modulo if necessary
@@ -965,285 +967,192 @@ class LotteryBall(QMainWindow):
     # Main app background logic 1
     def set_image_background(self, image_path): 
         self.image_path = image_path
+        self.background_source = QPixmap(image_path)  # Decoded once, scaled from memory after this
+        self.background_cache.clear()
         self.update_background()
 
     # Main app background logic 2
-    def update_background(self):    
-        palette = self.palette()
-        pixmap = QPixmap(self.image_path)
-        
-        # Scale the image based on the current window size
-        pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    def update_background(self, smooth=True):
+        """
+        Scale the background image to the current window size.
+
+        Args:
+            smooth (bool): Use a high-quality scale (cached per window size); a fast one
+                           is used while the window is being resized
+        """
+        size = self.size()
+        key = (size.width(), size.height())
+        pixmap = self.background_cache.get(key)
+        if pixmap is not None:
+            self.background_cache.move_to_end(key)
+        elif smooth:
+            pixmap = self.background_source.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            self.background_cache[key] = pixmap
+            if len(self.background_cache) > BACKGROUND_CACHE_SIZE:
+                self.background_cache.popitem(last=False)
+        else:
+            pixmap = self.background_source.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.FastTransformation)
         
         # Set the image as the background
+        palette = self.palette()
         palette.setBrush(QPalette.Background, QBrush(pixmap))
         self.setPalette(palette)
 
     # Update the image background whenever the window is resized
     def resizeEvent(self, event):
-        self.update_background()
+        # Fast scale while resizing; the smooth one runs once the size stops changing
+        self.update_background(smooth=False)
+        self.background_timer.start()
         super().resizeEvent(event)
         
     def display_recent_results(self, recent_results):
-        """Display recent lottery results in a card-based layout with BallWidget"""
-        # Clear previous results
-        while self.results_layout.count():
-            item = self.results_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Show placeholder if no results
+        """Display recent lottery results as cards with lottery balls"""
+        self.results_view.set_results(recent_results)
+        self.results_view.setVisible(bool(recent_results))
+
         if not recent_results:
-            self.no_results_label = QLabel("No recent results available. Use the 'Get Recent Results' button to fetch data.")
-            self.no_results_label.setAlignment(Qt.AlignCenter)
-            self.no_results_label.setFont(QFont("Roboto", 14))
-            self.no_results_label.setStyleSheet("color: rgba(255, 255, 255, 0.7); padding: 20px;")
-            self.no_results_label.setWordWrap(True)
-            self.results_layout.addWidget(self.no_results_label)
-            return
-        
-        # Add result cards
-        for i, result_data in enumerate(recent_results):
-            # Create a card for each result
-            result_card = QFrame()
-            result_card.setStyleSheet("""
-                QFrame {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                stop: 0 rgba(55, 55, 150, 0.7),
-                                stop: 1 rgba(60, 85, 180, 0.7));
-                    border-radius: 15px;
-                    padding: 5px;
-                }
-                QFrame:hover {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                stop: 0 rgba(60, 85, 180, 0.8),
-                                stop: 1 rgba(70, 95, 200, 0.8));
-                }
-            """)
-            
-            card_layout = QVBoxLayout(result_card)
-            card_layout.setSpacing(10)
-            
-            # Draw date
-            draw_date = result_data[0]
-            date_label = QLabel(f"Draw Date: {draw_date}")
-            date_label.setFont(QFont("Roboto", 16, QFont.Bold))
-            date_label.setStyleSheet("color: white; background: rgba(255, 255, 255, 0);")
-            date_label.setAlignment(Qt.AlignLeft)
-            card_layout.addWidget(date_label)
-            
-            # Numbers container
-            numbers_widget = QWidget()
-            numbers_layout = QHBoxLayout(numbers_widget)
-            numbers_layout.setSpacing(0)
-            numbers_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Add lottery balls for each number using BallWidget with custom size
-            for j in range(1, min(7, len(result_data))):
-                number = result_data[j]
-                if number:  # Only create a ball if there's a number
-                    # Create a random ball index (1-6)
-                    ball_index = (i + j) % 6 + 1
-                    
-                    # Create a BallWidget with custom size and font size
-                    ball = BallWidget(number, ball_index, asset_manager=self.asset_manager, size=100, font_size=24)
-                    
-                    numbers_layout.addWidget(ball)
-            
-            # Center the numbers
-            numbers_layout.addStretch()
-            numbers_layout.insertStretch(0)
-            
-            card_layout.addWidget(numbers_widget)
-            
-            # Add the card to the results layout
-            self.results_layout.addWidget(result_card)
-        
-        # Add a spacer at the end
-        self.results_layout.addStretch()
-        
-        # Also update the table for CSV export compatibility
-        self.update_results_table(recent_results)
-
-    def update_results_table(self, recent_results):
-        """Update the hidden table for CSV export compatibility"""
-        # Create the table if it doesn't exist
-        if not hasattr(self, 'recent_results_table'):
-            self.recent_results_table = QTableWidget()
-            self.recent_results_table.setColumnCount(7)
-            self.recent_results_table.setHorizontalHeaderLabels(["Date", "1", "2", "3", "4", "5", "6"])
-        
-        # Clear previous results
-        self.recent_results_table.setRowCount(0)
-        
-        # Add the results to the table
-        self.recent_results_table.setRowCount(len(recent_results))
-        for i, row_data in enumerate(recent_results):
-            for j, item in enumerate(row_data):
-                if j < self.recent_results_table.columnCount():
-                    self.recent_results_table.setItem(i, j, QTableWidgetItem(str(item)))
+            if self.fetch_error:
+                self.show_results_message(self.fetch_error)
+            else:
+                self.show_results_message(None)
+        elif self.fetch_error:
+            # Archived draws are still shown when PCSO couldn't be reached, but say they may be out of date
+            self.show_results_message("Could not update results. Showing saved results, which may be out of date.", warning=True)
+        else:
+            self.results_message_label.hide()
+
+    def show_results_message(self, message, warning=False):
+        """Show a note on the results tab; None shows the default placeholder"""
+        if message is None:
+            message = "No recent results available. Use the 'Get Recent Results' button to fetch data."
+        self.results_message_label.setText(message)
+        if warning:
+            self.results_message_label.setFont(QFont("Roboto", 12))
+            self.results_message_label.setStyleSheet("color: rgba(255, 220, 120, 0.9); padding: 5px;")
+        else:
+            self.results_message_label.setFont(QFont("Roboto", 14))
+            self.results_message_label.setStyleSheet("color: rgba(255, 255, 255, 0.7); padding: 20px;")
+        self.results_message_label.show()
 
     # --------- Functions related to populating the frequency table ---------
 
-    def populate_table(self, table, number_counter):
+    def populate_table(self, table, frequencies):
         """Populate the frequency table with data"""
-        table.setRowCount(len(number_counter))
-        for i, (num, freq) in enumerate(number_counter.most_common()):
+        min_num, _ = LOTTERY_CONFIG[self.selected_lottery_type]
+        ranked = lucky_numbers(frequencies, min_num, k=len(frequencies) - min_num)
+        table.setRowCount(len(ranked))
+        for i, num in enumerate(ranked):
             table.setItem(i, 0, QTableWidgetItem(str(num)))
-            table.setItem(i, 1, QTableWidgetItem(str(freq)))
+            table.setItem(i, 1, QTableWidgetItem(str(int(frequencies[num]))))
 
-    def update_frequency_display(self, number_counter):
-        """Update the frequency display with the number frequencies."""
+    def update_frequency_display(self, frequencies):
+        """Update the frequency display with the number frequencies (indexed by number)."""
         # Get the top 6 numbers based on frequency
-        top_6 = [num for num, _ in number_counter.most_common(6)]
-        
-        # Reset all boxes to default style first
-        for num, (box, freq_label) in self.number_labels.items():
-            box.setStyleSheet("""
-                QFrame {
-                    background-color: rgba(55, 55, 150, 0.5);
-                    border-radius: 10px;
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                }
-            """)
-            
-            # Set frequency to 0 by default
-            freq_label.setText("0")
+        game = GAMES[self.selected_lottery_type]
+        top = lucky_numbers(frequencies, game.min_num, game.pick)
         
-        # Update frequencies from the counter
-        for num, freq in number_counter.items():
-            if num in self.number_labels:
-                box, freq_label = self.number_labels[num]
-                freq_label.setText(str(freq))
-                
-                # Highlight top 6 numbers
-                if num in top_6:
-                    box.setStyleSheet("""
-                        QFrame {
-                            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                            stop: 0 rgba(255, 210, 80, 0.9),
-                                            stop: 1 rgba(245, 115, 35, 0.9));
-                            border-radius: 10px;
-                            border: 2px solid white;
-                        }
-                    """)
+        self.frequency_grid.set_frequencies(frequencies, top)
 
     def on_lottery_selection_changed(self):
         """Triggered when the lottery type selection changes"""
         self.selected_lottery_type = self.lottery_dropdown.currentText()
         
-        # Update the frequency grid for the new lottery type
+        # Update the frequency grid and balls for the new lottery type
         self.update_frequency_grid()
+        self.set_ball_count(GAMES[self.selected_lottery_type].pick)
+        self.update_lucky_label()
         
-        # Check and fetch results for the new lottery type
-        self.check_and_fetch_results()
+        # Fetch results for the new lottery type once the selection settles
+        self.schedule_fetch_results()
 
     def update_frequency_grid(self):
-        """Update the frequency grid based on the current lottery type"""
-        # Clear the existing grid
-        if hasattr(self, 'freq_grid') and self.freq_grid:
-            # Remove all widgets from the grid
-            while self.freq_grid.count():
-                item = self.freq_grid.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-        
-        # Clear the number_labels dictionary
-        self.number_labels = {}
-        
-        # Get the lottery type and its range
-        lottery_type = self.selected_lottery_type
-        min_num, max_num = LOTTERY_CONFIG[lottery_type]
-        
-        # Create number boxes for the grid
-        cols = 10  # Number of columns in the grid
-        for num in range(min_num, max_num + 1):
-            row = (num - 1) // cols
-            col = (num - 1) % cols
-            
-            # Create a box for each number
-            box = QFrame()
-            box.setFixedSize(60, 60)
-            box.setStyleSheet("""
-                QFrame {
-                    background-color: rgba(55, 55, 150, 0.5);
-                    border-radius: 10px;
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                }
-            """)
-            
-            # Create layout for the box
-            box_layout = QVBoxLayout(box)
-            box_layout.setContentsMargins(5, 5, 5, 5)
-            box_layout.setSpacing(2)
-            
-            # Number label
-            num_label = QLabel(str(num))
-            num_label.setAlignment(Qt.AlignCenter)
-            num_label.setFont(QFont("Roboto", 16, QFont.Bold))
-            num_label.setStyleSheet("color: white; background-color: transparent; border: none;")
-            
-            # Frequency label
-            freq_label = QLabel("0")
-            freq_label.setAlignment(Qt.AlignCenter)
-            freq_label.setFont(QFont("Roboto", 12))
-            freq_label.setStyleSheet("color: white; background-color: transparent; border: none;")
-            
-            # Add labels to box
-            box_layout.addWidget(num_label)
-            box_layout.addWidget(freq_label)
-            
-            # Add box to grid
-            self.freq_grid.addWidget(box, row, col)
-            
-            # Store reference to the box and frequency label
-            self.number_labels[num] = (box, freq_label)
+        """Show the numbers of the current lottery type, all with a count of zero"""
+        min_num, max_num = LOTTERY_CONFIG[self.selected_lottery_type]
+        self.frequency_grid.set_range(min_num, max_num)
 
     # Connected to GENERATE Button
     def generate_lucky_numbers(self):
-        # Disable the generate button while processing
-        self.generate_button.setEnabled(False)
-        self.generate_button.setText("GENERATING...")
+        # A click while a generation is running cancels it
+        if self.generate_thread is not None and self.generate_thread.isRunning():
+            self.generate_button.setEnabled(False)
+            self.generate_thread.cancel()
+            return
 
-        # Get selected lottery type
+        # Every generation gets an explicit seed that is stored in its history entry
         lottery_type = self.lottery_dropdown.currentText()
-        min_num, max_num = LOTTERY_CONFIG[lottery_type]
+        self.start_generation(lottery_type, self.sample_size_spinbox.value(), new_seed())
 
-        # Generate all valid combinations
-        all_combinations = list(combinations(range(min_num, max_num + 1), 6))
+    def replay_generation(self, lottery_type, sample_size, seed, workers):
+        """Regenerate a history entry from its seed without adding it to the history again"""
+        if self.generate_thread is not None and self.generate_thread.isRunning():
+            QMessageBox.information(self, "Generation Running", "Wait for the current generation to finish first.")
+            return
 
-        # Randomly select 1000 unique combinations
-        sampled_combinations = random.sample(all_combinations, 1000)
+        # Select the entry's game first so the grid, results and next GENERATE all follow it
+        self.lottery_dropdown.setCurrentText(lottery_type)
+        self.start_generation(lottery_type, sample_size, seed, workers, replay=True)
 
-        # Count frequency of each number in the 1000 combinations
-        number_counter = Counter(num for comb in sampled_combinations for num in comb)
+        # Show the regenerated numbers
+        self.current_tab_index = 0
+        self.stacked_widget.setCurrentIndex(self.current_tab_index)
+        self.tab_title_label.setText(self.tab_titles[self.current_tab_index])
+
+    def start_generation(self, lottery_type, sample_size, seed, workers=None, replay=False):
+        """Sample combinations for a lottery type in the background"""
+        game = GAMES[lottery_type]
+        self.replaying = replay
+
+        # The button cancels the job until it finishes
+        self.generate_button.setText("CANCEL")
+        self.lucky_label.setText("GENERATING...")
+
+        # Randomly sample the requested number of combinations in the background
+        self.generate_thread = GenerateNumbersThread(lottery_type, game.min_num, game.max_num, sample_size, seed,
+                                                   workers, game.pick)
+        self.generate_thread.progress.connect(self.on_generation_progress)
+        self.generate_thread.frequencies_updated.connect(self.on_partial_frequencies)
+        self.generate_thread.numbers_generated.connect(self.on_numbers_generated)
+        self.generate_thread.finished.connect(self.on_generation_finished)
+        self.generate_thread.start()
+
+    def on_generation_progress(self, done, total):
+        """Show how far the running generation is"""
+        self.lucky_label.setText(f"GENERATING... {done * 100 // total}%")
+
+    def on_partial_frequencies(self, lottery_type, frequencies):
+        """Show the running counts while a large sample is still being generated"""
+        if lottery_type == self.selected_lottery_type:
+            self.update_frequency_display(frequencies)
+
+    def on_numbers_generated(self, lottery_type, numbers, frequencies):
+        """Display the lucky numbers picked by a finished generation"""
+        lucky = [str(num).zfill(2) for num in numbers]
+        # The thread that finished, which need not be the latest one started
+        thread = self.sender()
+        if not self.replaying:
+            self.add_history(lottery_type, lucky, thread.seed, thread.sample_size, thread.workers)
+
+        # The game was changed while this job ran; its numbers are only kept in the history
+        if lottery_type != self.selected_lottery_type:
+            return
 
-        # Pick top 6 most frequent numbers
-        top_6 = [str(num).zfill(2) for num, _ in number_counter.most_common(6)]
-        
         # Store the lucky numbers
-        self.lucky_numbers = top_6
+        self.lucky_numbers = lucky
 
-        # Shuffle image indices for visual randomness (1–6)
+        # Shuffle image indices for visual randomness (1–6), reproducible from the seed
         ball_indices = list(range(1, 7))
-        random.shuffle(ball_indices)
+        random.Random(thread.seed).shuffle(ball_indices)
 
-        # Update the 6 BallWidgets
-        for i, (widget, num_str) in enumerate(zip(self.lottery_balls, top_6)):
-            widget.update_number(num_str, ball_indices[i])
+        # Update the BallWidgets
+        for i, (widget, num_str) in enumerate(zip(self.lottery_balls, lucky)):
+            widget.update_number(num_str, ball_indices[i % 6])
 
-        # Make sure the frequency grid is updated for the current lottery type
-        if lottery_type != self.selected_lottery_type:
-            self.selected_lottery_type = lottery_type
-            self.update_frequency_grid()
+        # Update the frequency display with the number frequencies
+        self.update_frequency_display(frequencies)
 
+    def on_generation_finished(self):
+        """Restore the GENERATE button once the job has finished or was cancelled"""
         self.update_lucky_label()
-
-        # Update the frequency display with the number counter
-        self.update_frequency_display(number_counter)
-        self.add_history(self.history_table, lottery_type, top_6)
-
-        # Re-enable the button
         self.generate_button.setEnabled(True)
         self.generate_button.setText("GENERATE")
     
@@ -1256,31 +1165,17 @@ class LotteryBall(QMainWindow):
                 # Collect numbers from the ball widgets and ensure they're clean
                 numbers = [ball.number.replace("`", "") for ball in self.lottery_balls]
                 
-                # Create a frequency data structure from the number_labels
-                frequency_data = []
-                for num, (_, freq_label) in sorted(self.number_labels.items()):
-                    frequency = freq_label.text().replace("`", "")
-                    frequency_data.append((str(num), frequency))
-                
-                # Check if recent_results_table exists, if not create an empty one
-                if not hasattr(self, 'recent_results_table'):
-                    self.recent_results_table = QTableWidget()
-                    self.recent_results_table.setColumnCount(7)
-                    self.recent_results_table.setHorizontalHeaderLabels(["Date", "1", "2", "3", "4", "5", "6"])
-                
-                # Check if history_table exists, if not create an empty one
-                if not hasattr(self, 'history_table'):
-                    self.history_table = QTableWidget()
-                    self.history_table.setColumnCount(7)
-                    self.history_table.setHorizontalHeaderLabels(["Lotto Type", "1", "2", "3", "4", "5", "6"])
+                # Take the frequencies shown in the frequency grid
+                frequency_data = self.frequency_grid.frequency_data()
                 
                 success = export_data_to_csv(
                     file_path,
                     f"Lucky Numbers: {'-'.join(numbers)}",
                     frequency_data,  # Pass the frequency data instead of freq_table
                     None,  # No combinations table in new UI (set to None)
-                    self.recent_results_table,
-                    self.history_table  # Internal QTableWidget used for history
+                    self.results_view.model().results,  # Rows straight from the results model
+                    self.history_store.export_rows(),  # History is read straight from storage
+                    GAMES[self.selected_lottery_type].pick
                 )
 
                 if success:
@@ -0,0 +1,120 @@
+import time
+
+from SQLiteStore import SQLiteStore
+
+# Seconds a response for a range that includes today stays fresh
+DEFAULT_TTL = 10 * 60
+# Seconds any response is kept, and the most responses kept, so the file can't grow without bound
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 500
+
+
+class CachedResponse:
+    """A stored response body with the validators the server sent along with it"""
+
+    def __init__(self, body, stored_at, immutable, etag=None, last_modified=None):
+        self.body = body
+        self.stored_at = stored_at
+        self.immutable = immutable
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, ttl):
+        return self.immutable or time.time() - self.stored_at < ttl
+
+    def validator_headers(self):
+        """Conditional request headers that let the server answer 304 Not Modified"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(SQLiteStore):
+    """
+    On-disk cache of PCSO search responses, keyed by (game id, start date, end date).
+
+    Responses for ranges that end before today can't change any more and stay
+    fresh until they are purged. Everything else is fresh for `ttl` seconds,
+    after which it can still be revalidated with its ETag / Last-Modified.
+    Nothing is kept longer than `max_age` seconds, and only the newest
+    `max_entries` responses are kept.
+    """
+
+    FILENAME = "responses.sqlite3"
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_age=DEFAULT_MAX_AGE, max_entries=DEFAULT_MAX_ENTRIES):
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+        with self.connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    game_id TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    immutable INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body TEXT NOT NULL,
+                    PRIMARY KEY (game_id, start_date, end_date)
+                )
+            """)
+
+    def get(self, game_id, start_date, end_date):
+        """The cached response for a search, fresh or not, or None"""
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT body, stored_at, immutable, etag, last_modified FROM responses "
+                "WHERE game_id = ? AND start_date = ? AND end_date = ?",
+                (game_id, start_date, end_date)
+            ).fetchone()
+        if row is None:
+            return None
+        body, stored_at, immutable, etag, last_modified = row
+        return CachedResponse(body, stored_at, bool(immutable), etag, last_modified)
+
+    def put(self, game_id, start_date, end_date, body, immutable, etag=None, last_modified=None):
+        """Store a response and purge old ones"""
+        with self.connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(game_id, start_date, end_date, stored_at, immutable, etag, last_modified, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (game_id, start_date, end_date, time.time(), int(immutable), etag, last_modified, body)
+            )
+        self.purge()
+
+    def purge(self):
+        """
+        Drop stale responses, responses older than max_age and all but the newest max_entries.
+
+        Returns:
+            int: Number of responses dropped
+        """
+        now = time.time()
+        with self.connect() as conn:
+            # Stale entries without validators can never be reused
+            dropped = conn.execute(
+                "DELETE FROM responses WHERE immutable = 0 AND stored_at < ? AND etag IS NULL AND last_modified IS NULL",
+                (now - self.ttl,)
+            ).rowcount
+            dropped += conn.execute("DELETE FROM responses WHERE stored_at < ?", (now - self.max_age,)).rowcount
+            dropped += conn.execute(
+                "DELETE FROM responses WHERE rowid NOT IN (SELECT rowid FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,)
+            ).rowcount
+        return dropped
+
+    def touch(self, game_id, start_date, end_date):
+        """Mark a cached response fresh again after the server answered 304 Not Modified"""
+        with self.connect() as conn:
+            conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE game_id = ? AND start_date = ? AND end_date = ?",
+                (time.time(), game_id, start_date, end_date)
+            )
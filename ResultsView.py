@@ -0,0 +1,118 @@
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize
+from PyQt5.QtGui import QFont, QPainter
+
+from BallWidget import paint_ball
+from Cards import BALL_FONT_SIZE, BALL_SIZE, CARD_PADDING, CARD_SPACING, paint_card_background
+
+# Rows handed to the view at a time; more are fetched as it scrolls
+FETCH_BATCH_SIZE = 100
+
+# Card layout, matching the look of the old per-draw QFrame cards
+DATE_HEIGHT = 30
+CARD_HEIGHT = CARD_PADDING + DATE_HEIGHT + CARD_PADDING + BALL_SIZE + CARD_PADDING
+
+
+class ResultsModel(QAbstractListModel):
+    """
+    Draws as [draw_date, n1, ..., nk] rows for the results view.
+
+    All rows are kept, but they are exposed to the view in batches through
+    canFetchMore / fetchMore, so a long archive is handed over as it scrolls.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results = []
+        self.loaded = 0
+
+    def set_results(self, results):
+        self.beginResetModel()
+        self.results = results
+        self.loaded = min(len(results), FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self.loaded:
+            return None
+        if role == Qt.DisplayRole:
+            return self.results[index.row()]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.results)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, len(self.results) - self.loaded)
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+
+class ResultCardDelegate(QStyledItemDelegate):
+    """Paints a draw as a rounded card with its date and a row of balls; no widgets per row"""
+
+    def __init__(self, asset_manager, parent=None):
+        super().__init__(parent)
+        self.asset_manager = asset_manager
+        self.date_font = QFont("Roboto", 16, QFont.Bold)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), CARD_HEIGHT + CARD_SPACING)
+
+    def paint(self, painter, option, index):
+        result_data = index.data()
+        if not result_data:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = paint_card_background(painter, option, CARD_HEIGHT)
+
+        # Draw date
+        painter.setPen(Qt.white)
+        painter.setFont(self.date_font)
+        date_rect = QRect(card.x() + CARD_PADDING * 2, card.y() + CARD_PADDING,
+                          card.width() - CARD_PADDING * 4, DATE_HEIGHT)
+        painter.drawText(date_rect, Qt.AlignLeft | Qt.AlignVCenter, f"Draw Date: {result_data[0]}")
+
+        # Balls, centered in the card
+        numbers = [number for number in result_data[1:] if number]
+        x = card.x() + (card.width() - BALL_SIZE * len(numbers)) // 2
+        y = date_rect.bottom() + 1 + CARD_PADDING
+        for j, number in enumerate(result_data[1:], start=1):
+            if not number:
+                continue
+            ball_index = (index.row() + j) % 6 + 1
+            paint_ball(painter, QRect(x, y, BALL_SIZE, BALL_SIZE), number, ball_index, self.asset_manager, BALL_FONT_SIZE)
+            x += BALL_SIZE
+
+        painter.restore()
+
+
+class ResultsView(QListView):
+    """List of result cards; only the rows on screen are ever painted"""
+
+    def __init__(self, asset_manager, parent=None):
+        super().__init__(parent)
+        self.results_model = ResultsModel(self)
+        self.setModel(self.results_model)
+        self.setItemDelegate(ResultCardDelegate(asset_manager, self))
+
+        # Every card has the same height, so the view can skip measuring rows
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(30)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)  # For the hover highlight
+
+    def set_results(self, results):
+        self.results_model.set_results(results)
+        self.scrollToTop()
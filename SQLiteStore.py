@@ -0,0 +1,34 @@
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+
+# Where the app keeps its databases, in the user's home directory so they survive app updates
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".lets_play_lotto")
+
+
+class SQLiteStore:
+    """
+    Base for the app's SQLite files (draw archive, response cache, history).
+
+    Subclasses set FILENAME for their default location in DATA_DIR and create
+    their tables with connect().
+    """
+
+    FILENAME = None
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DATA_DIR, self.FILENAME)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @contextmanager
+    def connect(self):
+        """
+        A connection for one unit of work, committed on success and always closed.
+
+        A new connection per call keeps the store usable from any thread.
+        """
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            with conn:
+                yield conn
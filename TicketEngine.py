@@ -0,0 +1,289 @@
+import os
+import secrets
+from functools import lru_cache
+from math import comb
+
+import numpy as np
+
+# Tickets generated per chunk when streaming a sample; bounds memory use
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Range of Monte Carlo sample sizes offered to the user
+MIN_SAMPLE_SIZE = 10 ** 3
+MAX_SAMPLE_SIZE = 10 ** 9
+
+# Samples from which spreading the work over a process pool pays off
+PARALLEL_MIN_SAMPLE_SIZE = 10 ** 7
+
+# Upper bound on tasks each worker's share is split into, for progress and cancellation
+SLICES_PER_WORKER = 16
+
+
+@lru_cache(maxsize=None)
+def binomial_table(n, k):
+    """
+    Table of binomial coefficients with table[c, i] == C(c, i), built once per (n, k).
+
+    Args:
+        n (int): Largest pool size needed
+        k (int): Largest combination size needed
+
+    Returns:
+        numpy.ndarray: Read-only int64 array of shape (n + 1, k + 1)
+    """
+    table = np.zeros((n + 1, k + 1), dtype=np.int64)
+    for c in range(n + 1):
+        for i in range(min(c, k) + 1):
+            table[c, i] = comb(c, i)
+    # The table is shared by every caller, so it must never change
+    table.setflags(write=False)
+    return table
+
+
+def unrank_combinations(ranks, n, k, table=None):
+    """
+    Vectorized counterpart of Combinatorics.unrank_combination.
+
+    Args:
+        ranks (array-like): Ranks in [0, C(n, k))
+        n (int): Size of the pool the combinations are drawn from
+        k (int): Numbers per combination
+        table (numpy.ndarray): Optional precomputed binomial_table(n, k)
+
+    Returns:
+        numpy.ndarray: int64 array of shape (len(ranks), k), each row ascending in range(n)
+    """
+    if table is None:
+        table = binomial_table(n, k)
+
+    remaining = np.array(ranks, dtype=np.int64)
+    combos = np.empty((remaining.shape[0], k), dtype=np.int64)
+    for i in range(k, 0, -1):
+        column = table[:, i]
+        # Largest c such that C(c, i) <= rank, found for every rank at once
+        c = np.searchsorted(column, remaining, side="right") - 1
+        combos[:, i - 1] = c
+        remaining -= column[c]
+    return combos
+
+
+def generate_tickets(min_num, max_num, count, k=6, rng=None, unique=False):
+    """
+    Generate tickets for a game as one compact array.
+
+    Args:
+        min_num (int): Smallest number in the game
+        max_num (int): Largest number in the game
+        count (int): Number of tickets to generate
+        k (int): Numbers per ticket
+        rng (numpy.random.Generator): Random source, a fresh default_rng() if None
+        unique (bool): Whether every ticket must be a distinct combination
+
+    Returns:
+        numpy.ndarray: uint8 array of shape (count, k), each row ascending
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    n = max_num - min_num + 1
+    table = binomial_table(n, k)
+    total = int(table[n, k])
+    if unique:
+        ranks = rng.choice(total, size=count, replace=False)
+    else:
+        ranks = rng.integers(0, total, size=count, dtype=np.int64)
+
+    tickets = unrank_combinations(ranks, n, k, table)
+    tickets += min_num
+    return tickets.astype(np.uint8)
+
+
+def number_frequencies(tickets, max_num):
+    """
+    Count how often every number appears across the tickets.
+
+    Returns:
+        numpy.ndarray: int64 array where frequencies[num] is the count of num
+    """
+    return np.bincount(tickets.ravel(), minlength=max_num + 1).astype(np.int64)
+
+
+def lucky_numbers(frequencies, min_num=1, k=6):
+    """
+    Pick the k most frequent numbers, most frequent first (ties go to the smaller number).
+
+    Returns:
+        list: The lucky numbers as ints
+    """
+    counts = frequencies[min_num:]
+    order = np.argsort(-counts, kind="stable")[:k]
+    return [int(num) + min_num for num in order]
+
+
+def stream_tickets(min_num, max_num, count, k=6, rng=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate count tickets as a series of (chunk_size, k) arrays.
+
+    Tickets are distinct combinations when they all fit in a single chunk
+    and independent draws otherwise.
+
+    Yields:
+        numpy.ndarray: uint8 ticket arrays of at most chunk_size rows
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    unique = count <= chunk_size
+
+    done = 0
+    while done < count:
+        size = min(chunk_size, count - done)
+        yield generate_tickets(min_num, max_num, size, k, rng=rng, unique=unique)
+        done += size
+
+
+def stream_frequencies(min_num, max_num, sample_size, k=6, rng=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Count number frequencies over sample_size tickets, one fixed-size chunk at a time.
+
+    Memory stays at one chunk plus the running counters however large the
+    sample is.
+
+    Yields:
+        tuple: (samples done, running frequencies) after every chunk. The
+            frequencies array is updated in place, copy it to keep a snapshot.
+    """
+    frequencies = np.zeros(max_num + 1, dtype=np.int64)
+
+    done = 0
+    for tickets in stream_tickets(min_num, max_num, sample_size, k, rng, chunk_size):
+        frequencies += number_frequencies(tickets, max_num)
+        done += len(tickets)
+        yield done, frequencies
+
+
+def new_seed():
+    """Fresh 64-bit seed for a generation run, recorded so the run can be replayed."""
+    return secrets.randbits(64)
+
+
+def split_sample(sample_size, parts):
+    """Split sample_size into parts shares that differ by at most one."""
+    base, extra = divmod(sample_size, parts)
+    return [base + 1 if i < extra else base for i in range(parts)]
+
+
+def default_workers(sample_size):
+    """Worker processes to use for a sample: all cores for big samples, otherwise one."""
+    if sample_size < PARALLEL_MIN_SAMPLE_SIZE:
+        return 1
+    return os.cpu_count() or 1
+
+
+def plan_tasks(sample_size, seed, workers, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Split a sample into (share, seed sequence) tasks.
+
+    Every worker gets its own child of SeedSequence(seed), and each slice of
+    that worker's share gets its own child of the worker's sequence. The plan
+    only depends on (sample_size, seed, workers), which is what makes the
+    merged counts reproducible.
+
+    Returns:
+        list: (share, numpy.random.SeedSequence) tuples
+    """
+    tasks = []
+    worker_seeds = np.random.SeedSequence(seed).spawn(workers)
+    for share, worker_seed in zip(split_sample(sample_size, workers), worker_seeds):
+        slices = max(1, min(SLICES_PER_WORKER, share // chunk_size))
+        for slice_share, slice_seed in zip(split_sample(share, slices), worker_seed.spawn(slices)):
+            if slice_share:
+                tasks.append((slice_share, slice_seed))
+    return tasks
+
+
+def count_task(min_num, max_num, share, seed_seq, k=6, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Count number frequencies for one task of a plan. Runs inside a worker process."""
+    rng = np.random.default_rng(seed_seq)
+    frequencies = np.zeros(max_num + 1, dtype=np.int64)
+    for _, frequencies in stream_frequencies(min_num, max_num, share, k, rng, chunk_size):
+        pass
+    return frequencies
+
+
+def stream_parallel_frequencies(min_num, max_num, sample_size, seed, workers=None, k=6,
+                                chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Count number frequencies with the sample split across a process pool.
+
+    The result is bit-identical for a given (seed, workers) no matter which
+    order the tasks finish in. With workers == 1 the same plan runs in this
+    process, without a pool.
+
+    Args:
+        seed (int): Root seed every worker stream is derived from
+        workers (int): Number of worker processes, default_workers(sample_size) if None
+
+    Yields:
+        tuple: (samples done, running frequencies) after every finished task.
+            Closing the generator cancels the tasks that have not started.
+    """
+    if workers is None:
+        workers = default_workers(sample_size)
+
+    tasks = plan_tasks(sample_size, seed, workers, chunk_size)
+    frequencies = np.zeros(max_num + 1, dtype=np.int64)
+    done = 0
+
+    if workers == 1:
+        # Same tasks as count_task, but reporting after every chunk
+        for share, seed_seq in tasks:
+            rng = np.random.default_rng(seed_seq)
+            for task_done, task_frequencies in stream_frequencies(min_num, max_num, share, k, rng, chunk_size):
+                yield done + task_done, frequencies + task_frequencies
+            frequencies += task_frequencies
+            done += share
+        return
+
+    # Imported here so single-process users (e.g. the CLI) don't pay for multiprocessing
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # Forking copies the caller's threads' locks in whatever state they are in, which can
+    # deadlock the workers when this runs in a QThread; spawned workers start clean
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures = {
+            executor.submit(count_task, min_num, max_num, share, seed_seq, k, chunk_size): share
+            for share, seed_seq in tasks
+        }
+        for future in as_completed(futures):
+            frequencies += future.result()
+            done += futures[future]
+            yield done, frequencies
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parallel_frequencies(min_num, max_num, sample_size, seed, workers=None, k=6,
+                         chunk_size=DEFAULT_CHUNK_SIZE):
+    """Merged number frequencies of a stream_parallel_frequencies run."""
+    frequencies = np.zeros(max_num + 1, dtype=np.int64)
+    for _, frequencies in stream_parallel_frequencies(min_num, max_num, sample_size, seed, workers, k, chunk_size):
+        pass
+    return frequencies
+
+
+def stream_seeded_tickets(min_num, max_num, count, seed, workers=1, k=6, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate the tickets of a (seed, workers) run as a series of (chunk_size, k) arrays.
+
+    The tasks of plan_tasks are run one after another in this process, so these
+    are exactly the tickets a stream_parallel_frequencies run with the same
+    arguments counts.
+
+    Yields:
+        numpy.ndarray: uint8 ticket arrays of at most chunk_size rows
+    """
+    for share, seed_seq in plan_tasks(count, seed, workers, chunk_size):
+        yield from stream_tickets(min_num, max_num, share, k, np.random.default_rng(seed_seq), chunk_size)
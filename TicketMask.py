@@ -0,0 +1,82 @@
+import numpy as np
+
+# Number of set bits in every byte value, used when numpy has no bitwise_count
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def encode_ticket(numbers):
+    """
+    Encode a ticket or draw as a 64-bit mask with bit n set for every number n.
+
+    Every game's numbers are at most 58, so one 64-bit integer holds a whole ticket.
+
+    Args:
+        numbers (iterable): Numbers as ints or zero-padded strings like "05"; blanks are skipped
+
+    Returns:
+        int: The mask
+    """
+    mask = 0
+    for num in numbers:
+        if num != "":
+            mask |= 1 << int(num)
+    return mask
+
+
+def decode_mask(mask):
+    """Return the ascending numbers whose bits are set in mask."""
+    mask = int(mask)
+    return [num for num in range(64) if mask >> num & 1]
+
+
+def encode_tickets(tickets):
+    """
+    Encode a (N, k) ticket array as N uint64 masks.
+
+    Args:
+        tickets (numpy.ndarray): Integer array of shape (N, k), e.g. from TicketEngine.generate_tickets
+
+    Returns:
+        numpy.ndarray: uint64 array of shape (N,)
+    """
+    bits = np.left_shift(np.uint64(1), np.asarray(tickets).astype(np.uint64))
+    return np.bitwise_or.reduce(bits, axis=1)
+
+
+def encode_draws(results):
+    """
+    Encode draws as uint64 masks.
+
+    Args:
+        results (list): (draw_date, numbers) tuples from fetch_latest_winning_numbers or
+            [draw_date, n1, ..., n6] rows from FetchResultsThread
+
+    Returns:
+        numpy.ndarray: uint64 array with one mask per draw
+    """
+    masks = []
+    for result in results:
+        numbers = result[1] if len(result) == 2 else result[1:]
+        masks.append(encode_ticket(numbers))
+    return np.array(masks, dtype=np.uint64)
+
+
+def popcount(masks):
+    """Count the set bits of every uint64 in masks."""
+    masks = np.asarray(masks, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks)
+
+    # Older numpy: look up each of the 8 bytes and add them up
+    as_bytes = masks.reshape(masks.shape + (1,)).view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+def match_counts(ticket_masks, draw_mask):
+    """
+    Count how many numbers every ticket shares with a draw.
+
+    Returns:
+        numpy.ndarray: uint8 array with one match count per ticket
+    """
+    return popcount(np.bitwise_and(ticket_masks, np.uint64(draw_mask)))
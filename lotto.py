@@ -0,0 +1,254 @@
+"""
+Headless command-line interface for the lottery number generator.
+
+Example:
+    python -m lotto generate --game "Ultra Lotto 6/58" --count 1000000 --seed 42
+
+Nothing here imports PyQt5, so it runs on machines without a display. NumPy and
+the scraping libraries are only imported by the commands that use them.
+
+Tickets are generated from the same SeedSequence plan as the GUI's generations,
+so a seed and worker count from the GUI history give the same tickets here.
+"""
+import argparse
+import sys
+
+from Backfill import backfill as run_backfill, CHUNK_MONTHS, DEFAULT_CHUNK_MONTHS, DEFAULT_RATE, DEFAULT_WORKERS
+from DrawArchive import DrawArchive
+from Games import GAMES, get_game
+
+
+def format_tickets(tickets, output_format):
+    """
+    Render a chunk of tickets as bytes, one ticket per line.
+
+    Numbers are at most two digits, so every line has the same width and the
+    whole chunk is built with array arithmetic instead of per-number strings.
+
+    Args:
+        tickets (numpy.ndarray): uint8 array of shape (N, k)
+        output_format (str): "csv" for 05,12,... lines or "jsonl" for [ 5,12,...] lines
+
+    Returns:
+        bytes: The encoded lines
+    """
+    import numpy as np
+
+    rows, k = tickets.shape
+    tens = tickets // 10
+    ones = tickets % 10
+
+    # Each number takes 3 bytes: two digits and the separator that follows it
+    cells = np.empty((rows, k, 3), dtype=np.uint8)
+    if output_format == "csv":
+        cells[:, :, 0] = tens + ord("0")
+    else:
+        # JSON numbers can't have leading zeros, pad with a space instead
+        cells[:, :, 0] = np.where(tens == 0, ord(" "), tens + ord("0"))
+    cells[:, :, 1] = ones + ord("0")
+    cells[:, :, 2] = ord(",")
+    cells[:, -1, 2] = ord("\n")
+
+    if output_format == "csv":
+        return cells.tobytes()
+
+    # Wrap each line in brackets, dropping the last number's separator
+    lines = np.empty((rows, 3 * k + 2), dtype=np.uint8)
+    lines[:, 0] = ord("[")
+    lines[:, 1:-2] = cells.reshape(rows, 3 * k)[:, :-1]
+    lines[:, -2] = ord("]")
+    lines[:, -1] = ord("\n")
+    return lines.tobytes()
+
+
+def generate(args):
+    """Stream tickets for a game to stdout or a file"""
+    from TicketEngine import DEFAULT_CHUNK_SIZE, new_seed, stream_seeded_tickets
+
+    game = args.game
+    seed = args.seed if args.seed is not None else new_seed()
+    print(f"Seed: {seed}", file=sys.stderr)
+
+    tickets = stream_seeded_tickets(game.min_num, game.max_num, args.count, seed, args.workers, game.pick,
+                                    args.chunk_size or DEFAULT_CHUNK_SIZE)
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        if args.format == "csv" and not args.no_header:
+            output.write(",".join(f"n{i}" for i in range(1, game.pick + 1)).encode() + b"\n")
+        for chunk in tickets:
+            output.write(format_tickets(chunk, args.format))
+        output.flush()
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+
+def backtest(args):
+    """Generate tickets and count their 3/4/5/6-number hits against fetched draws"""
+    from Backtest import stream_hit_counts
+    from TicketEngine import new_seed, stream_seeded_tickets
+
+    game = args.game
+    seed = args.seed if args.seed is not None else new_seed()
+    print(f"Seed: {seed}", file=sys.stderr)
+
+    # Draws come from the local archive, topped up from PCSO where it has gaps
+    archive = DrawArchive(args.archive)
+    sync_archive(archive, game, args.from_date, args.to_date)
+    results = archive.draws(game.name, args.from_date, args.to_date)
+    if not results:
+        print("No draws found for that game and date range.", file=sys.stderr)
+        return 1
+
+    # Tickets are generated and counted a chunk at a time, so --count isn't bounded by memory
+    tickets = stream_seeded_tickets(game.min_num, game.max_num, args.count, seed, args.workers, game.pick)
+    _, hits = stream_hit_counts(tickets, results)
+
+    print(f"Tickets: {args.count}")
+    print(f"Draws: {len(results)}")
+    for level, count in hits.items():
+        # Compare against what pure chance predicts for this many ticket/draw pairs
+        expected = game.match_probability(level) * args.count * len(results)
+        print(f"{level} matches: {count} (expected {expected:.1f})")
+    return 0
+
+
+def sync_archive(archive, game, from_date, to_date):
+    """Top up the archive for a game, warning instead of failing when PCSO can't be reached"""
+    # Imported here so ticket generation doesn't pay for the scraping libraries
+    from FetchLatest import FetchError
+
+    try:
+        fetched = archive.sync(game.name, from_date, to_date)
+        print(f"Fetched {fetched} new draw(s) of {game.name}", file=sys.stderr)
+    except FetchError as e:
+        print(f"Could not reach PCSO, using archived draws only: {e}", file=sys.stderr)
+
+
+def sync(args):
+    """Download missing draws of a game, or of every game, into the local archive"""
+    from FetchLatest import FetchError
+
+    archive = DrawArchive(args.archive)
+    try:
+        if args.game:
+            fetched = {args.game.name: archive.sync(args.game.name, args.from_date, args.to_date)}
+        else:
+            fetched = archive.sync_all(args.from_date, args.to_date)
+    except FetchError as e:
+        print(f"Could not reach PCSO: {e}", file=sys.stderr)
+        return 1
+    for name, count in fetched.items():
+        print(f"Fetched {count} new draw(s) of {name}", file=sys.stderr)
+    return 0
+
+
+def backfill(args):
+    """Download a long range of draws in concurrent chunks, resuming an interrupted run"""
+    def report(done, total):
+        print(f"\rChunks: {done}/{total}", end="", file=sys.stderr, flush=True)
+
+    archive = DrawArchive(args.archive)
+    fetched, failed = run_backfill(archive, args.game.name, args.from_date, args.to_date, months=args.chunk_months,
+                                   workers=args.workers, rate=args.rate, progress=report)
+    print(file=sys.stderr)
+    print(f"Fetched {fetched} draw(s) of {args.game.name}", file=sys.stderr)
+    for (start, end), error in sorted(failed, key=lambda item: item[0]):
+        print(f"Failed {start:%m/%d/%Y}-{end:%m/%d/%Y}: {error}", file=sys.stderr)
+    if failed:
+        print("Run the same command again to retry the failed chunks", file=sys.stderr)
+        return 1
+    return 0
+
+
+def game_type(name):
+    """argparse type accepting any game name or alias"""
+    try:
+        return get_game(name)
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"unknown game {name!r} (choose from {', '.join(GAMES)})")
+
+
+def bounded_type(convert, minimum, description):
+    """argparse type converting with convert and rejecting values below minimum"""
+    def parse(text):
+        try:
+            value = convert(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid value {text!r}, expected {description}")
+        if not value >= minimum:  # Also rejects nan
+            raise argparse.ArgumentTypeError(f"{text} is not {description}")
+        return value
+    return parse
+
+
+# Tickets follow the plan of a GUI generation with this many workers; they are still made in one process
+WORKERS_HELP = "Workers of the GUI generation to reproduce with --seed (default: 1)"
+
+positive_int = bounded_type(int, 1, "a positive integer")
+non_negative_int = bounded_type(int, 0, "a non-negative integer")
+non_negative_float = bounded_type(float, 0, "a non-negative number")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="lotto", description="Generate lottery tickets without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="Stream randomly generated tickets as CSV or JSONL")
+    generate_parser.add_argument("--game", required=True, type=game_type, help="Lottery game, e.g. \"Lotto 6/42\"")
+    generate_parser.add_argument("--count", type=positive_int, default=1000, help="Number of tickets (default: 1000)")
+    generate_parser.add_argument("--seed", type=non_negative_int, help="Seed for a reproducible run (default: random, printed to stderr)")
+    generate_parser.add_argument("--workers", type=positive_int, default=1, help=WORKERS_HELP)
+    generate_parser.add_argument("--format", choices=["csv", "jsonl"], default="csv", help="Output format (default: csv)")
+    generate_parser.add_argument("--output", help="File to write to (default: stdout)")
+    generate_parser.add_argument("--no-header", action="store_true", help="Leave out the CSV header row")
+    # Changes which tickets a seed gives, so it's only for benchmarks
+    generate_parser.add_argument("--chunk-size", type=positive_int, help=argparse.SUPPRESS)
+    generate_parser.set_defaults(handler=generate)
+
+    backtest_parser = commands.add_parser("backtest", help="Count hits of generated tickets against past draws")
+    backtest_parser.add_argument("--game", required=True, type=game_type, help="Lottery game, e.g. \"Lotto 6/42\"")
+    backtest_parser.add_argument("--count", type=positive_int, default=100000, help="Number of tickets (default: 100000)")
+    backtest_parser.add_argument("--seed", type=non_negative_int, help="Seed for a reproducible run (default: random, printed to stderr)")
+    backtest_parser.add_argument("--workers", type=positive_int, default=1, help=WORKERS_HELP)
+    backtest_parser.add_argument("--from", dest="from_date", required=True, help="First draw date, MM/DD/YYYY")
+    backtest_parser.add_argument("--to", dest="to_date", required=True, help="Last draw date, MM/DD/YYYY")
+    backtest_parser.add_argument("--archive", help="Draw archive file (default: ~/.lets_play_lotto/draws.sqlite3)")
+    backtest_parser.set_defaults(handler=backtest)
+
+    sync_parser = commands.add_parser("sync", help="Download draws into the local archive")
+    sync_parser.add_argument("--game", type=game_type, help="Lottery game, e.g. \"Lotto 6/42\" (default: every game, in one search)")
+    sync_parser.add_argument("--from", dest="from_date", required=True, help="First draw date, MM/DD/YYYY")
+    sync_parser.add_argument("--to", dest="to_date", required=True, help="Last draw date, MM/DD/YYYY")
+    sync_parser.add_argument("--archive", help="Draw archive file (default: ~/.lets_play_lotto/draws.sqlite3)")
+    sync_parser.set_defaults(handler=sync)
+
+    backfill_parser = commands.add_parser("backfill", help="Download years of draws in concurrent chunks (resumable)")
+    backfill_parser.add_argument("--game", required=True, type=game_type, help="Lottery game, e.g. \"Lotto 6/42\"")
+    backfill_parser.add_argument("--from", dest="from_date", required=True, help="First draw date, MM/DD/YYYY")
+    backfill_parser.add_argument("--to", dest="to_date", required=True, help="Last draw date, MM/DD/YYYY")
+    backfill_parser.add_argument("--chunk-months", type=int, choices=CHUNK_MONTHS, default=DEFAULT_CHUNK_MONTHS,
+                                 help=f"Months per search (default: {DEFAULT_CHUNK_MONTHS})")
+    backfill_parser.add_argument("--workers", type=positive_int, default=DEFAULT_WORKERS,
+                                 help=f"Searches running at once (default: {DEFAULT_WORKERS})")
+    backfill_parser.add_argument("--rate", type=non_negative_float, default=DEFAULT_RATE,
+                                 help=f"Most searches started per second, 0 for no limit (default: {DEFAULT_RATE:g})")
+    backfill_parser.add_argument("--archive", help="Draw archive file (default: ~/.lets_play_lotto/draws.sqlite3)")
+    backfill_parser.set_defaults(handler=backfill)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head), which is not an error
+        sys.stderr.close()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 
 
@@ -6,35 +7,12 @@ from PyQt5.QtWidgets import QApplication
 from AssetManager import AssetManager
 from SplashScreen import SplashScreen
 
-# Lottery configurations from config.py
-LOTTERY_CONFIG = {
-    "Ultra Lotto 6/58": (1, 58), 
-    "Grand Lotto 6/55": (1, 55), 
-    "Superlotto 6/49": (1, 49), 
-    "Megalotto 6/45": (1, 45), 
-    "Lotto 6/42": (1, 42)
-}
-
-MONTH_MAP = {
-    "01": "January", "02": "February", "03": "March", "04": "April",
-    "05": "May", "06": "June", "07": "July", "08": "August",
-    "09": "September", "10": "October", "11": "November", "12": "December"
-}
-
-LOTTERY_TYPE_MAP = {
-    "All Games": "0",
-    "Ultra Lotto 6/58": "18",
-    "Grand Lotto 6/55": "17",
-    "Super Lotto 6/49": "1",
-    "Mega Lotto 6/45": "2",
-    "Lotto 6/42": "13",
-}
-
-
-asset_manager = AssetManager()
-    
 
 if __name__ == "__main__":
+    # Lets the bundled executable start the generation worker processes
+    multiprocessing.freeze_support()
+
+    asset_manager = AssetManager()
     app = QApplication(sys.argv)
     splash = SplashScreen(asset_manager=asset_manager)
     splash.show()
@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Backfill import split_range  # noqa: E402
+
+
+class SplitRangeTest(unittest.TestCase):
+    """Chunks must tile the range exactly, along calendar month or quarter edges"""
+
+    def assert_tiles(self, chunks, first, last):
+        self.assertEqual(chunks[0][0], first)
+        self.assertEqual(chunks[-1][1], last)
+        for (_, end), (next_start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(next_start, end + timedelta(days=1))
+        for start, end in chunks:
+            self.assertLessEqual(start, end)
+
+    def test_months(self):
+        chunks = split_range(date(2023, 11, 15), date(2024, 2, 10), months=1)
+        self.assertEqual(chunks, [
+            (date(2023, 11, 15), date(2023, 11, 30)),
+            (date(2023, 12, 1), date(2023, 12, 31)),
+            (date(2024, 1, 1), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 2, 10)),
+        ])
+
+    def test_quarters_follow_the_calendar(self):
+        chunks = split_range(date(2023, 2, 20), date(2024, 1, 5), months=3)
+        self.assertEqual(chunks, [
+            (date(2023, 2, 20), date(2023, 3, 31)),
+            (date(2023, 4, 1), date(2023, 6, 30)),
+            (date(2023, 7, 1), date(2023, 9, 30)),
+            (date(2023, 10, 1), date(2023, 12, 31)),
+            (date(2024, 1, 1), date(2024, 1, 5)),
+        ])
+
+    def test_single_day(self):
+        self.assertEqual(split_range(date(2024, 2, 29), date(2024, 2, 29)), [(date(2024, 2, 29), date(2024, 2, 29))])
+
+    def test_empty_range(self):
+        self.assertEqual(split_range(date(2024, 3, 1), date(2024, 2, 1)), [])
+
+    def test_long_ranges_tile(self):
+        first, last = date(2015, 7, 17), date(2024, 12, 31)
+        for months in (1, 3):
+            with self.subTest(months=months):
+                chunks = split_range(first, last, months)
+                self.assert_tiles(chunks, first, last)
+                # Every chunk after the first starts on a calendar month or quarter
+                self.assertTrue(all(start.day == 1 and (start.month - 1) % months == 0 for start, _ in chunks[1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
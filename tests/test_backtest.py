@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Backtest import HIT_LEVELS, backtest, stream_hit_counts  # noqa: E402
+from TicketEngine import generate_tickets, stream_tickets  # noqa: E402
+
+
+class BacktestTest(unittest.TestCase):
+    """Chunked match counting must give the same answer as comparing every ticket with every draw"""
+
+    MIN_NUM, MAX_NUM = 1, 42
+    CHUNK_CELLS = 1000  # Small, so the tickets are matched in many blocks
+
+    def setUp(self):
+        rng = np.random.default_rng(9)
+        self.tickets = generate_tickets(self.MIN_NUM, self.MAX_NUM, 3000, rng=rng)
+        self.results = [
+            (f"1/{day}/2024", [str(num).zfill(2) for num in draw])
+            for day, draw in enumerate(generate_tickets(self.MIN_NUM, self.MAX_NUM, 25, rng=rng).tolist(), start=1)
+        ]
+
+    def brute_force(self):
+        draws = [set(int(num) for num in numbers) for _, numbers in self.results]
+        matrix = np.array([[len(set(ticket) & draw) for draw in draws] for ticket in self.tickets.tolist()])
+        return matrix, {level: int((matrix == level).sum()) for level in HIT_LEVELS}
+
+    def test_match_matrix_and_hits(self):
+        expected_matrix, expected_hits = self.brute_force()
+        matrix, hits = backtest(self.tickets, self.results, chunk_cells=self.CHUNK_CELLS)
+        np.testing.assert_array_equal(matrix, expected_matrix)
+        self.assertEqual(hits, expected_hits)
+
+    def test_hits_without_matrix(self):
+        _, expected_hits = self.brute_force()
+        matrix, hits = backtest(self.tickets, self.results, keep_matrix=False, chunk_cells=self.CHUNK_CELLS)
+        self.assertIsNone(matrix)
+        self.assertEqual(hits, expected_hits)
+
+    def test_streamed_chunks_add_up(self):
+        _, expected_hits = self.brute_force()
+        chunks = (self.tickets[start:start + 700] for start in range(0, len(self.tickets), 700))
+        self.assertEqual(stream_hit_counts(chunks, self.results, self.CHUNK_CELLS), (len(self.tickets), expected_hits))
+
+    def test_stream_tickets_input(self):
+        rng = np.random.default_rng(10)
+        count, hits = stream_hit_counts(stream_tickets(self.MIN_NUM, self.MAX_NUM, 5000, rng=rng, chunk_size=1024),
+                                        self.results)
+        self.assertEqual(count, 5000)
+        self.assertEqual(sorted(hits), list(HIT_LEVELS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Combinatorics import rank_combination, unrank_combination  # noqa: E402
+from Games import GAMES  # noqa: E402
+from TicketEngine import unrank_combinations  # noqa: E402
+
+
+def colex_combinations(n, k):
+    """Every k-combination of range(n) in colex order, the order ranks count in"""
+    return sorted(combinations(range(n), k), key=lambda combination: combination[::-1])
+
+
+class RankingTest(unittest.TestCase):
+    """Ranks must number the combinations of itertools.combinations one to one, in colex order"""
+
+    SIZES = [(1, 1), (5, 0), (5, 5), (7, 3), (10, 4), (12, 6)]
+
+    def test_unrank_enumerates_every_combination(self):
+        for n, k in self.SIZES:
+            with self.subTest(n=n, k=k):
+                expected = colex_combinations(n, k)
+                self.assertEqual([unrank_combination(rank, n, k) for rank in range(comb(n, k))], expected)
+
+    def test_rank_is_the_inverse_of_unrank(self):
+        for n, k in self.SIZES:
+            with self.subTest(n=n, k=k):
+                for rank, combination in enumerate(colex_combinations(n, k)):
+                    self.assertEqual(rank_combination(combination, n, k), rank)
+                    # The order of the numbers doesn't matter
+                    self.assertEqual(rank_combination(reversed(combination), n, k), rank)
+
+    def test_vectorized_unrank_matches(self):
+        for n, k in self.SIZES:
+            with self.subTest(n=n, k=k):
+                ranks = np.arange(comb(n, k))
+                self.assertEqual([tuple(row) for row in unrank_combinations(ranks, n, k).tolist()],
+                                 colex_combinations(n, k))
+
+    def test_out_of_range_rank(self):
+        with self.assertRaises(ValueError):
+            unrank_combination(comb(7, 3), 7, 3)
+        with self.assertRaises(ValueError):
+            unrank_combination(-1, 7, 3)
+
+    def test_game_ranks_span_every_ticket(self):
+        for game in GAMES.values():
+            with self.subTest(game=game.name):
+                last = game.total_combinations - 1
+                self.assertEqual(game.unrank(0), tuple(range(game.min_num, game.min_num + game.pick)))
+                self.assertEqual(game.unrank(last), tuple(range(game.max_num - game.pick + 1, game.max_num + 1)))
+                ranks = np.random.default_rng(1).integers(0, game.total_combinations, 200)
+                tickets = unrank_combinations(ranks, game.pool_size, game.pick) + game.min_num
+                for rank, ticket in zip(ranks.tolist(), tickets.tolist()):
+                    self.assertEqual(game.rank(ticket), rank)
+                    self.assertEqual(list(game.unrank(rank)), ticket)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DrawArchive import DrawArchive  # noqa: E402
+from FetchLatest import FetchFormError, iter_results  # noqa: E402
+
+GAME = "Lotto 6/42"
+
+
+def day(month, day_of_month):
+    return date(2024, month, day_of_month)
+
+
+class SyncedIntervalsTest(unittest.TestCase):
+    """mark_synced must keep one interval per run of synced days, and missing_ranges its complement"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.archive = DrawArchive(os.path.join(directory.name, "draws.sqlite3"))
+
+    def test_disjoint_intervals_stay_apart(self):
+        self.archive.mark_synced(GAME, day(3, 1), day(3, 10))
+        self.archive.mark_synced(GAME, day(1, 1), day(1, 10))
+        self.assertEqual(self.archive.synced_intervals(GAME), [(day(1, 1), day(1, 10)), (day(3, 1), day(3, 10))])
+
+    def test_overlapping_intervals_merge(self):
+        self.archive.mark_synced(GAME, day(1, 1), day(1, 20))
+        self.archive.mark_synced(GAME, day(1, 10), day(2, 5))
+        self.assertEqual(self.archive.synced_intervals(GAME), [(day(1, 1), day(2, 5))])
+
+    def test_adjacent_intervals_merge(self):
+        self.archive.mark_synced(GAME, day(1, 1), day(1, 31))
+        self.archive.mark_synced(GAME, day(2, 1), day(2, 29))
+        self.assertEqual(self.archive.synced_intervals(GAME), [(day(1, 1), day(2, 29))])
+
+    def test_interval_bridging_several_merges_them_all(self):
+        self.archive.mark_synced(GAME, day(1, 1), day(1, 5))
+        self.archive.mark_synced(GAME, day(1, 10), day(1, 15))
+        self.archive.mark_synced(GAME, day(1, 20), day(1, 25))
+        self.archive.mark_synced(GAME, day(1, 6), day(1, 19))
+        self.assertEqual(self.archive.synced_intervals(GAME), [(day(1, 1), day(1, 25))])
+
+    def test_games_are_kept_apart(self):
+        self.archive.mark_synced(GAME, day(1, 1), day(1, 31))
+        self.assertEqual(self.archive.synced_intervals("Mega Lotto 6/45"), [])
+
+    def test_missing_ranges(self):
+        self.archive.mark_synced(GAME, day(1, 10), day(1, 20))
+        self.archive.mark_synced(GAME, day(2, 1), day(2, 10))
+
+        self.assertEqual(self.archive.missing_ranges(GAME, day(1, 1), day(2, 29)),
+                         [(day(1, 1), day(1, 9)), (day(1, 21), day(1, 31)), (day(2, 11), day(2, 29))])
+        # Only the requested dates are returned, not gaps outside of them
+        self.assertEqual(self.archive.missing_ranges(GAME, day(1, 15), day(1, 25)), [(day(1, 21), day(1, 25))])
+        self.assertEqual(self.archive.missing_ranges(GAME, day(1, 12), day(1, 18)), [])
+        self.assertTrue(self.archive.is_synced(GAME, day(2, 1), day(2, 10)))
+        self.assertFalse(self.archive.is_synced(GAME, day(1, 1), day(1, 10)))
+
+    def test_sync_fetches_only_missing_ranges(self):
+        self.archive.mark_synced(GAME, day(1, 10), day(1, 20))
+        searches = []
+
+        def search(game, from_date, to_date):
+            searches.append((from_date, to_date))
+            return [(from_date.lstrip("0"), ["01", "02", "03", "04", "05", "06"])]
+
+        self.assertEqual(self.archive.sync(GAME, "01/01/2024", "01/31/2024", search), 2)
+        self.assertEqual(searches, [("01/01/2024", "01/09/2024"), ("01/21/2024", "01/31/2024")])
+        self.assertEqual(self.archive.synced_intervals(GAME), [(day(1, 1), day(1, 31))])
+
+    def test_page_without_results_table_is_not_marked_synced(self):
+        def search(game, from_date, to_date):
+            return iter_results("<html><body>Site under maintenance</body></html>", game)
+
+        with self.assertRaises(FetchFormError):
+            self.archive.sync(GAME, "01/01/2024", "01/31/2024", search)
+        self.assertEqual(self.archive.synced_intervals(GAME), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FetchLatest import FetchFormError, iter_all_results, iter_table_rows, parse_results_page  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "Benchmarks", "fixtures", "pcso_results_2024_01.html")
+
+PAGE = """
+<html><body>
+<form>
+<TABLE class="search-lotto-result-table" id="GridView1">
+    <tr><th>LOTTO GAME</th><th>COMBINATIONS</th><th>DRAW DATE</th><th>JACKPOT (PHP)</th><th>WINNERS</th></tr>
+    <tr>
+        <td>Lotto 6/42</td><td>14-27-15-42-03-40</td><td>1/30/2024</td><td>24,994,000.00</td><td>0</td>
+    </tr>
+    <tr><td>3D Lotto 9PM</td><td>3-7-2</td><td>1/30/2024</td><td>17,841,813.00</td><td>108</td></tr>
+    <tr><td><span>Mega Lotto 6/45</span></td><td>35-16-41-32-23-7</td><td>1/29/2024</td><td>284,745,000.00</td><td>1</td></tr>
+    <TR><TD>Lotto 6/42</TD><TD>1-2-3-4-5-6</TD><TD>1/27/2024</TD><TD>Q&amp;A</TD><TD>0</TD></TR>
+</TABLE>
+<table><tr><td>Lotto 6/42</td><td>9-9-9-9-9-9</td><td>1/1/2024</td><td>0</td><td>0</td></tr></table>
+</form>
+</body></html>
+"""
+
+
+class ResultsParserTest(unittest.TestCase):
+    """The regex parser must read the first table of a PCSO page and nothing else"""
+
+    def test_table_rows(self):
+        rows = list(iter_table_rows(PAGE))
+        # The header has no <td> cells, the second table is never read
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0], ["Lotto 6/42", "14-27-15-42-03-40", "1/30/2024", "24,994,000.00", "0"])
+        # Tags inside cells are dropped and entities decoded
+        self.assertEqual(rows[2][0], "Mega Lotto 6/45")
+        self.assertEqual(rows[3][3], "Q&A")
+
+    def test_all_results_skip_digit_games_and_resolve_aliases(self):
+        self.assertEqual(list(iter_all_results(PAGE)), [
+            ("Lotto 6/42", "1/30/2024", ["14", "27", "15", "42", "03", "40"]),
+            ("Megalotto 6/45", "1/29/2024", ["35", "16", "41", "32", "23", "07"]),
+            ("Lotto 6/42", "1/27/2024", ["01", "02", "03", "04", "05", "06"]),
+        ])
+
+    def test_results_of_one_game(self):
+        self.assertEqual(parse_results_page(PAGE, "Lotto 6/42"), [
+            ("1/30/2024", ["14", "27", "15", "42", "03", "40"]),
+            ("1/27/2024", ["01", "02", "03", "04", "05", "06"]),
+        ])
+        # Games are matched through the registry, so an alias finds the same draws
+        self.assertEqual(parse_results_page(PAGE, "Mega Lotto 6/45"), parse_results_page(PAGE, "Megalotto 6/45"))
+        self.assertEqual(parse_results_page(PAGE, "Lotto 6/42", limit=1), [("1/30/2024", ["14", "27", "15", "42", "03", "40"])])
+        self.assertEqual(len(parse_results_page(PAGE, "All Games")), 3)
+
+    def test_empty_results_table(self):
+        page = "<table><tr><th>LOTTO GAME</th><th>COMBINATIONS</th></tr></table>"
+        self.assertEqual(parse_results_page(page, "Lotto 6/42"), [])
+
+    def test_page_without_table_raises(self):
+        with self.assertRaises(FetchFormError):
+            parse_results_page("<html><body>The site is under maintenance.</body></html>", "Lotto 6/42")
+
+    def test_saved_results_page(self):
+        with open(FIXTURE, encoding="utf-8") as f:
+            html = f.read()
+        results = parse_results_page(html, "Lotto 6/42")
+        self.assertTrue(results)
+        for draw_date, numbers in results:
+            self.assertRegex(draw_date, r"^1/\d{1,2}/2024$")
+            self.assertEqual(len(numbers), 6)
+            self.assertTrue(all(1 <= int(num) <= 42 for num in numbers))
+
+
+if __name__ == "__main__":
+    unittest.main()
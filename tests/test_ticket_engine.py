@@ -0,0 +1,39 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TicketEngine import count_task, parallel_frequencies, plan_tasks  # noqa: E402
+
+
+class ParallelFrequenciesTest(unittest.TestCase):
+    """A generation must be reproducible from its (seed, workers)"""
+
+    MIN_NUM, MAX_NUM = 1, 42
+    SAMPLE_SIZE = 50_000
+    SEED = 20240101
+    WORKERS = 3
+    CHUNK_SIZE = 4096  # Small, so every worker's share is split into several slices
+
+    def run_parallel(self):
+        return parallel_frequencies(self.MIN_NUM, self.MAX_NUM, self.SAMPLE_SIZE, self.SEED,
+                                    workers=self.WORKERS, chunk_size=self.CHUNK_SIZE)
+
+    def test_same_seed_and_workers_give_identical_counts(self):
+        np.testing.assert_array_equal(self.run_parallel(), self.run_parallel())
+
+    def test_pool_matches_the_plan_run_in_process(self):
+        expected = np.zeros(self.MAX_NUM + 1, dtype=np.int64)
+        for share, seed_seq in plan_tasks(self.SAMPLE_SIZE, self.SEED, self.WORKERS, self.CHUNK_SIZE):
+            expected += count_task(self.MIN_NUM, self.MAX_NUM, share, seed_seq, chunk_size=self.CHUNK_SIZE)
+
+        frequencies = self.run_parallel()
+        np.testing.assert_array_equal(frequencies, expected)
+        self.assertEqual(frequencies.sum(), self.SAMPLE_SIZE * 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
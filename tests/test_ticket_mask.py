@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TicketMask import decode_mask, encode_draws, encode_ticket, encode_tickets, match_counts, popcount  # noqa: E402
+
+
+class TicketMaskTest(unittest.TestCase):
+    """Masks and match counts must agree with plain set arithmetic, with or without np.bitwise_count"""
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        self.tickets = np.sort(np.array([rng.choice(np.arange(1, 59), 6, replace=False) for _ in range(500)]), axis=1)
+        # Random 64-bit masks, plus the edge cases of no bits and all bits
+        self.masks = np.concatenate([
+            rng.integers(0, 2 ** 64 - 1, 1000, dtype=np.uint64, endpoint=True),
+            np.array([0, 2 ** 64 - 1, 2 ** 63], dtype=np.uint64),
+        ])
+
+    def both_popcounts(self):
+        """Run the calling test's loop once with np.bitwise_count and once with the byte-table fallback"""
+        yield "bitwise_count"
+        if hasattr(np, "bitwise_count"):
+            bitwise_count = np.bitwise_count
+            del np.bitwise_count
+            try:
+                yield "fallback"
+            finally:
+                np.bitwise_count = bitwise_count
+        else:
+            yield "fallback"
+
+    def test_popcount_matches_bin(self):
+        expected = [bin(int(mask)).count("1") for mask in self.masks]
+        for mode in self.both_popcounts():
+            with self.subTest(mode=mode):
+                self.assertEqual(popcount(self.masks).tolist(), expected)
+
+    def test_encode_tickets_matches_encode_ticket(self):
+        masks = encode_tickets(self.tickets)
+        self.assertEqual(masks.tolist(), [encode_ticket(ticket) for ticket in self.tickets.tolist()])
+        self.assertEqual([decode_mask(mask) for mask in masks], self.tickets.tolist())
+
+    def test_encode_draws_accepts_results_and_table_rows(self):
+        results = [("1/2/2024", ["01", "12", "23", "34", "45", "58"]), ("1/4/2024", ["05", "06", "07", "08", "09", "10"])]
+        rows = [[draw_date] + numbers for draw_date, numbers in results]
+        # Table rows of games that pick fewer numbers are padded with blanks
+        rows.append(["1/6/2024", "03", "04", "05", "", "", ""])
+
+        expected = [encode_ticket(numbers) for _, numbers in results]
+        self.assertEqual(encode_draws(results).tolist(), expected)
+        self.assertEqual(encode_draws(rows).tolist(), expected + [encode_ticket([3, 4, 5])])
+
+    def test_match_counts_match_set_intersections(self):
+        draws = self.tickets[:20]
+        ticket_masks = encode_tickets(self.tickets)
+        for mode in self.both_popcounts():
+            for draw in draws.tolist():
+                with self.subTest(mode=mode, draw=draw):
+                    expected = [len(set(ticket) & set(draw)) for ticket in self.tickets.tolist()]
+                    self.assertEqual(match_counts(ticket_masks, encode_ticket(draw)).tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()